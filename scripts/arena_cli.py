@@ -20,7 +20,7 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.config_manager import ConfigManager
+from src.config_manager import get_config_manager
 
 
 @click.group()
@@ -28,7 +28,7 @@ from src.config_manager import ConfigManager
 def cli(ctx):
     """The Email Game developer tools for building and testing agents."""
     ctx.ensure_object(dict)
-    ctx.obj['config'] = ConfigManager()
+    ctx.obj['config'] = get_config_manager()
 
 
 @cli.command()
@@ -41,13 +41,14 @@ def join(ctx, agent_id, username, server):
     config = ctx.obj['config']
     
     # Resolve parameters with defaults
-    server_url = server or config.get_server_url()
+    default_server, default_agent_id = config.get_defaults()
+    server_url = server or default_server
     if not server_url:
         click.echo("❌ No server URL provided. Use --server or run 'arena config'")
         return
     
     if not agent_id:
-        agent_id = config.get_agent_id() or f"dev_{int(time.time())}"
+        agent_id = default_agent_id or f"dev_{int(time.time())}"
         click.echo(f"📝 Using agent ID: {agent_id}")
     
     username = username or agent_id.title()
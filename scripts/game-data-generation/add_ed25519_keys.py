@@ -0,0 +1,46 @@
+"""Add an Ed25519 key pair to each agent in data/sample_agents.json.
+
+Agents that already have `ed25519_private_key` / `ed25519_public_key` are left
+untouched, so the script is safe to re-run after adding new agents.
+
+Run:
+    python scripts/game-data-generation/add_ed25519_keys.py
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+AGENTS_FILE = PROJECT_ROOT / "data" / "sample_agents.json"
+
+
+def main() -> None:
+    data = json.loads(AGENTS_FILE.read_text())
+    agents = data.get("agents", [])
+
+    added = 0
+    for agent in agents:
+        if agent.get("ed25519_private_key") and agent.get("ed25519_public_key"):
+            continue
+        private_key = ed25519.Ed25519PrivateKey.generate()
+        agent["ed25519_private_key"] = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        agent["ed25519_public_key"] = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode()
+        added += 1
+
+    AGENTS_FILE.write_text(json.dumps(data, indent=2))
+    print(f"Added Ed25519 keys to {added} of {len(agents)} agents.")
+
+
+if __name__ == "__main__":
+    main()
@@ -110,6 +110,11 @@ def main():
     username = sys.argv[3]
     server_url = sys.argv[4]
     
+    log_listener = None
+    if module_name == "src.custom_base_agent":
+        from src.custom_llm_driver import setup_logging
+        log_listener = setup_logging()
+    
     # Run the agent with signal handling
     try:
         asyncio.run(run_agent_with_signals(module_name, agent_id, username, server_url))
@@ -118,6 +123,9 @@ def main():
     except Exception as e:
         print(f"❌ Fatal error: {e}")
         sys.exit(1)
+    finally:
+        if log_listener is not None:
+            log_listener.stop()  # drain pending driver log records
 
 
 if __name__ == "__main__":
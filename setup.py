@@ -28,6 +28,7 @@ setup(
         "pydantic>=1.8.0",
         "click>=8.0.0",
         "openai>=1.0.0",
+        "orjson>=3.6.0",
         "PyJWT>=2.0.0",
         "cryptography>=3.4.0",
         "python-multipart>=0.0.5",
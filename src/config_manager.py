@@ -3,21 +3,99 @@ Configuration management for The Email Game.
 Handles server URLs, agent IDs, and other settings across different environments.
 """
 
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+
+
+_PROD_SERVER_URL = "https://inbox-arena-owk4jthsnq-uc.a.run.app"
+
+
+@functools.lru_cache(maxsize=16)
+def _read_bytes_cached(path: str, mtime_ns: int) -> Optional[bytes]:
+    """Read a config file's raw bytes, memoized on (path, mtime)."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError as e:
+        print(f"⚠️  Ignoring unreadable config {path}: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _read_json_cached(path: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Parse a config file, memoized on (path, mtime) so edits invalidate it.
+    
+    Malformed files are cached as None and warned about once per version.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    raw = _read_bytes_cached(path, mtime_ns)
+    if raw is None:
+        return None
+    try:
+        config = json.loads(raw)
+        if not isinstance(config, dict):
+            raise ValueError("top-level value is not an object")
+    except ValueError as e:
+        print(f"⚠️  Ignoring unreadable config {path}: {e}")
+        return None
+    return config
 
 
 class ConfigManager:
     """Manages configuration for The Email Game agents and CLI tools."""
     
     def __init__(self):
-        self.config_paths = [
-            Path.home() / ".inbox_arena" / "config.json",  # Global config
-            Path("./agent_config.json"),                   # Project config
-            Path("./.env")                                  # Environment file
-        ]
+        self._config_paths: Optional[List[Path]] = None
+        self._config_path_strs: Optional[List[str]] = None
+    
+    @property
+    def config_paths(self) -> List[Path]:
+        """Config file locations, resolved once on first file-based lookup."""
+        if self._config_paths is None:
+            self._config_paths = [
+                (Path.home() / ".inbox_arena" / "config.json").resolve(strict=False),  # Global config
+                Path("agent_config.json").resolve(strict=False),                       # Project config
+                Path(".env").resolve(strict=False)                                     # Environment file
+            ]
+        return self._config_paths
+    
+    @property
+    def _json_config_strs(self) -> List[str]:
+        """String forms of the JSON config paths (excluding .env) for os-level calls."""
+        if self._config_path_strs is None:
+            self._config_path_strs = [os.fspath(p) for p in self.config_paths[:-1]]
+        return self._config_path_strs
+    
+    def _load_json(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return the parsed config at ``path``, or None if missing or malformed."""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        return _read_json_cached(path, mtime_ns)
+    
+    def _get_key(self, json_key: str) -> Optional[Any]:
+        """Return the first value for ``json_key`` across the config files.
+        
+        Files whose raw bytes don't mention the key are skipped without
+        being parsed.
+        """
+        needle = f'"{json_key}"'.encode()
+        for path_str in self._json_config_strs:
+            try:
+                mtime_ns = os.stat(path_str).st_mtime_ns
+            except OSError:
+                continue
+            raw = _read_bytes_cached(path_str, mtime_ns)
+            if raw is None or needle not in raw:
+                continue
+            config = _read_json_cached(path_str, mtime_ns)
+            if config and json_key in config:
+                return config[json_key]
+        return None
     
     def get_server_url(self) -> Optional[str]:
         """Get server URL with priority: env > local config > global config."""
@@ -27,19 +105,13 @@ class ConfigManager:
             return env_url
         
         # Check config files
-        for config_path in self.config_paths[:-1]:  # Skip .env
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        config = json.load(f)
-                        if 'server_url' in config:
-                            return config['server_url']
-                except Exception:
-                    continue
+        server_url = self._get_key('server_url')
+        if server_url is not None:
+            return server_url
         
         # Check for production server in environment
         if os.getenv("INBOX_ARENA_PROD"):
-            return "https://inbox-arena-owk4jthsnq-uc.a.run.app"
+            return _PROD_SERVER_URL
         
         return None
     
@@ -51,51 +123,80 @@ class ConfigManager:
             return env_id
         
         # Check config files
-        for config_path in self.config_paths[:-1]:  # Skip .env
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        config = json.load(f)
-                        if 'agent_id' in config:
-                            return config['agent_id']
-                except Exception:
-                    continue
+        return self._get_key('agent_id')
+    
+    def get_defaults(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get (server_url, agent_id) in one pass over the config files."""
+        server_url = os.getenv("INBOX_ARENA_SERVER")
+        agent_id = os.getenv("INBOX_ARENA_AGENT_ID")
         
-        return None
+        # Check config files, stopping as soon as both are known
+        if not (server_url and agent_id):
+            for path_str in self._json_config_strs:
+                config = self._load_json(path_str) or {}
+                server_url = server_url or config.get('server_url')
+                agent_id = agent_id or config.get('agent_id')
+                if server_url and agent_id:
+                    break
+        
+        # Check for production server in environment
+        if not server_url and os.getenv("INBOX_ARENA_PROD"):
+            server_url = _PROD_SERVER_URL
+        
+        return server_url, agent_id
     
-    def save_config(self, config: Dict[str, Any], path: Optional[Path] = None) -> None:
-        """Save configuration to specified path or default local config."""
-        if path is None:
-            path = Path("./agent_config.json")
+    def save_config(self, config: Dict[str, Any], path: Optional[Path] = None,
+                    pretty: bool = False) -> None:
+        """Save configuration to specified path or default local config.
+        
+        Output is compact JSON unless ``pretty`` is set.
+        """
+        path_str = os.fspath(path) if path is not None else "agent_config.json"
         
         # Create directory if needed
-        path.parent.mkdir(parents=True, exist_ok=True)
+        parent_dir = os.path.dirname(path_str)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
         
         # Load existing config if it exists
         existing_config = {}
-        if path.exists():
+        loaded = False
+        if os.path.exists(path_str):
             try:
-                with open(path) as f:
+                with open(path_str) as f:
                     existing_config = json.load(f)
+                loaded = True
             except Exception:
                 pass
         
-        # Merge configurations
-        existing_config.update(config)
+        # Merge configurations, skipping the write if nothing changed
+        merged_config = {**existing_config, **config}
+        if loaded and merged_config == existing_config:
+            return
+        existing_config = merged_config
         
-        # Save updated config
-        with open(path, 'w') as f:
-            json.dump(existing_config, f, indent=2)
+        # Write to a sibling temp file and swap it in so a crash mid-write
+        # never leaves a truncated config behind
+        tmp_path = path_str + '.tmp'
+        with open(tmp_path, 'w') as f:
+            if pretty:
+                json.dump(existing_config, f, indent=2)
+            else:
+                json.dump(existing_config, f, separators=(',', ':'))
+        os.replace(tmp_path, path_str)
+        _read_bytes_cached.cache_clear()
+        _read_json_cached.cache_clear()
     
     def load_all_configs(self) -> Dict[str, Dict[str, Any]]:
         """Load all available configurations for debugging."""
         configs = {}
         
         # Environment variables
+        env = os.environ
         configs['environment'] = {
-            'INBOX_ARENA_SERVER': os.getenv('INBOX_ARENA_SERVER'),
-            'INBOX_ARENA_AGENT_ID': os.getenv('INBOX_ARENA_AGENT_ID'),
-            'OPENAI_API_KEY': '***' if os.getenv('OPENAI_API_KEY') else None,
+            'INBOX_ARENA_SERVER': env.get('INBOX_ARENA_SERVER'),
+            'INBOX_ARENA_AGENT_ID': env.get('INBOX_ARENA_AGENT_ID'),
+            'OPENAI_API_KEY': '***' if env.get('OPENAI_API_KEY') else None,
         }
         
         # Config files
@@ -107,4 +208,15 @@ class ConfigManager:
                 except Exception as e:
                     configs[str(config_path)] = {'error': str(e)}
         
-        return configs
\ No newline at end of file
+        return configs
+
+
+_instance: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Return the process-wide ConfigManager, creating it on first use."""
+    global _instance
+    if _instance is None:
+        _instance = ConfigManager()
+    return _instance
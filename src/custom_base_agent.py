@@ -5,28 +5,140 @@ Base Agent - Phase 1
 # Standard libraries
 import json
 import asyncio
+import functools
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import base64
 import os
+import random
+import threading
+import time
 
 # Cryptography imports
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import ed25519
 
 # Third-party
+import httpx
+import orjson
 import requests
-import jwt  # PyJWT – used for decoding token expiry
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import websockets
 from dotenv import load_dotenv
-from .custom_llm_driver import CustomLLMDriver
+
+try:
+    import uvloop  # type: ignore
+except ImportError:  # pragma: no cover
+    uvloop = None  # Optional faster event loop; stock asyncio is used otherwise
+from .custom_llm_driver import CustomLLMDriver, setup_logging
 from .game.config import OPENAI_MODEL
 
 # Auto-load local .env so OPENAI_API_KEY and other secrets are available
 load_dotenv()
 
+# Repo paths, resolved once at import
+_MODULE_ROOT = Path(__file__).resolve().parent
+_PROJECT_ROOT = _MODULE_ROOT.parent
+_AGENTS_FILE = _PROJECT_ROOT / "data" / "sample_agents.json"
+_PROMPT_FILE = _PROJECT_ROOT / "docs" / "agent_prompt.md"
+_TRANSCRIPT_DIR = _PROJECT_ROOT / "transcripts"
+
+def _extract_exp(token: str) -> float:
+    """Read the `exp` claim from a JWT payload without verifying the signature."""
+    payload_b64 = token.split(".")[1]
+    payload_b64 += "=" * (-len(payload_b64) % 4)
+    return float(json.loads(base64.urlsafe_b64decode(payload_b64)).get("exp", 0))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_agents_index() -> Dict[str, Dict[str, Any]]:
+    """Parse sample_agents.json once per process, indexed by agent id."""
+    with open(_AGENTS_FILE, 'r') as f:
+        data = json.load(f)
+    return {agent['id']: agent for agent in data['agents']}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_agent_keys(agent_id: str) -> tuple:
+    """Return (rsa_private, rsa_public, ed25519_private or None) for *agent_id*.
+    
+    Raises ValueError for agents not in sample_agents.json. Key objects are
+    cached so PEM parsing runs once per agent per process.
+    """
+    agent_data = _load_agents_index().get(agent_id)
+    if not agent_data:
+        raise ValueError(f"Agent {agent_id} not found in sample_agents.json")
+    
+    private_key = serialization.load_pem_private_key(
+        agent_data['rsa_private_key'].encode(),
+        password=None
+    )
+    public_key = serialization.load_pem_public_key(
+        agent_data['rsa_public_key'].encode()
+    )
+    
+    ed_private_key = None
+    if agent_data.get('ed25519_private_key'):
+        ed_private_key = serialization.load_pem_private_key(
+            agent_data['ed25519_private_key'].encode(),
+            password=None
+        )
+    
+    return private_key, public_key, ed_private_key
+
+
+# Marker separating the human-readable reply from the signed-message JSON
+_SIGNED_MARKER = "SIGNED_MESSAGE_JSON:"
+
+# Body of the inactivity reminder email (only id/timestamp vary per send)
+_REMINDER_BODY = (
+    "REMINDER: Ensure you have completed all required actions for this round.\n\n"
+    "Check if you have:\n"
+    "- Submitted ALL signatures you received (missing submissions cost points)\n"
+    "- Responded to ALL signature requests you're authorized for\n"
+    "- Completed ALL tasks from the moderator's instructions\n\n"
+    "Remember your system prompt requirements:\n"
+    "- ALWAYS use function calls when taking action\n"
+    "- NEVER respond with markdown code blocks\n"
+    "- Submit every signature you receive immediately\n\n"
+    "Review your recent messages and ensure no actions are incomplete."
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_system_prompt(path: str) -> str:
+    """Read a system prompt file once per process (cleared on hot reload)."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+class _LRUSet:
+    """Set of recently seen keys that forgets the oldest once *maxsize* is hit."""
+    
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._items: "OrderedDict[str, None]" = OrderedDict()
+    
+    def add(self, key: str) -> None:
+        self._items[key] = None
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+    
+    def __contains__(self, key: object) -> bool:
+        if key in self._items:
+            self._items.move_to_end(key)
+            return True
+        return False
+    
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 class CustomBaseAgent:
     """Basic agent for The Email Game"""
     
@@ -37,6 +149,11 @@ class CustomBaseAgent:
         self.agent_id = agent_id
         self.username = username
         self.email_server_url = email_server_url
+        # WebSocket endpoint without the token (the token may be refreshed between connects)
+        self._ws_base = (
+            email_server_url.replace("http://", "ws://").replace("https://", "wss://")
+            + f"/ws/{agent_id}"
+        )
         print(f"[{self.agent_id}] Creating BaseAgent with server: {email_server_url}")
         self.moderator_agent = moderator_agent
         self.dev_mode = dev_mode
@@ -49,8 +166,19 @@ class CustomBaseAgent:
         
         # Inactivity reminder system
         self.can_send_reminder = False  # Set to True when moderator message received
-        self.last_message_time = datetime.now()
+        self.last_message_time = time.monotonic()
         self.inactivity_threshold_seconds = 25  # Send reminder after 25 seconds of inactivity
+        self._inactivity_handle: Optional[asyncio.TimerHandle] = None
+        
+        # Signature submissions are batched into one moderator email
+        self.signature_batch_size = 8
+        self.signature_batch_window = 0.25  # seconds
+        self.signature_retry_delay = 2.0  # seconds before re-sending a failed batch
+        self._pending_signatures: List[Dict[str, Any]] = []
+        self._pending_lock = threading.Lock()  # appended from tool-call worker threads
+        # Flush timer and in-flight sends – only touched on the agent's loop
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: set = set()
         
         # ------------------------------------------------------------------
         # RSA signing capability + JWT auth state
@@ -58,20 +186,53 @@ class CustomBaseAgent:
 
         self.rsa_private_key, self.rsa_public_key = self._load_rsa_keys()
 
+        # Signing parameters are immutable – build them once, not per signature
+        self._pss_padding = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.MAX_LENGTH
+        )
+        self._hash_algo = hashes.SHA256()
+        self._agent_id_bytes = self.agent_id.encode()
+
+        # Ed25519 key used for game signatures when the agent data provides one
+        # (much cheaper to sign and 64-byte signatures); RSA is the fallback.
+        self._ed_private_key: Optional[ed25519.Ed25519PrivateKey] = self._load_ed25519_key()
+
         # Keep PEM around for registration
         self._public_key_pem: str = self.rsa_public_key.public_bytes(
             serialization.Encoding.PEM,
             serialization.PublicFormat.SubjectPublicKeyInfo,
         ).decode()
 
+        # Pooled keep-alive HTTP session shared by every call to the email server
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        self._http.headers.update({"Connection": "keep-alive"})
+        # Async client for calls made from inside the event loop (created lazily)
+        self._aclient: Optional[httpx.AsyncClient] = None
+
         # JWT auth fields
         self._jwt_token: Optional[str] = None
         self._jwt_expiry: float = 0.0  # unix timestamp
+        # Authorization header for the current token; rebuilt only on token change
+        self._bearer_header_cache: Dict[str, str] = {}
         print(f"[{self.agent_id}] Initial token state: {self._jwt_token}")
         
         # Async task for the WebSocket listener
         self._ws_task: Optional[asyncio.Task] = None
         
+        # LLM calls are awaited on the event loop, fed in order by a single
+        # consumer task; the driver runs tool callables in worker threads
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._llm_queue: Optional[asyncio.Queue] = None
+        self._llm_task: Optional[asyncio.Task] = None
+        
         # Development mode features
         if self.dev_mode:
             self._setup_dev_features()
@@ -83,9 +244,9 @@ class CustomBaseAgent:
         self._join_queue()
         
         # LLM driver setup
-        prompt_file = Path(__file__).resolve().parent.parent / "docs" / "agent_prompt.md"
+        prompt_file = _PROMPT_FILE
         try:
-            system_prompt = prompt_file.read_text(encoding="utf-8")
+            system_prompt = _load_system_prompt(str(prompt_file))
         except FileNotFoundError:
             system_prompt = "Inbox Arena agent system prompt (file not found)"
 
@@ -102,9 +263,13 @@ class CustomBaseAgent:
         )
         
         # Deduplication – keep track of message_ids we have already processed so
-        # reconnect-triggered backlog replays do not feed the same email to the
-        # LLM multiple times.
-        self._seen_message_ids: set[str] = set()
+        # reconnect-triggered replays do not feed the same email to the LLM
+        # multiple times.
+        # Bounded so long-running agents don't accumulate ids forever.
+        self._seen_message_ids = _LRUSet(maxsize=4096)
+        # Last server message id seen – sent as ?since= so the server only
+        # replays what we missed on reconnect
+        self._last_seen_message_id: Optional[str] = None
     
     def register_with_moderator(self) -> bool:
         """Register this agent with the moderator"""
@@ -117,12 +282,12 @@ class CustomBaseAgent:
     def _register_with_server(self) -> None:
         """Register this agent with the email server and cache the JWT."""
 
-        if self._jwt_token and (self._jwt_expiry - datetime.utcnow().timestamp() > 120):
+        if self._jwt_token and (self._jwt_expiry - time.time() > 120):
             return  # still valid
 
         url = f"{self.email_server_url}/register_agent"
         payload = {"agent_id": self.agent_id, "rsa_public_key": self._public_key_pem}
-        r = requests.post(url, json=payload, timeout=10)
+        r = self._http.post(url, json=payload, timeout=10)
 
         if r.status_code == 409:
             # Already registered – keep existing token if valid, or get new one in _join_queue
@@ -131,14 +296,21 @@ class CustomBaseAgent:
 
         r.raise_for_status()
         data = r.json()
-        self._jwt_token = data["token"]
+        self._set_token(data["token"])
+
+    def _set_token(self, token: Optional[str]) -> None:
+        """Store a new JWT, decoding its expiry once and resetting the header cache."""
+        self._jwt_token = token
+        self._bearer_header_cache = {}
+        if token is None:
+            self._jwt_expiry = 0.0
+            return
 
         # Decode to get expiry (without verifying signature – we only need 'exp')
         try:
-            payload = jwt.decode(self._jwt_token, options={"verify_signature": False}, algorithms=["HS256"])
-            self._jwt_expiry = float(payload.get("exp", 0))
+            self._jwt_expiry = _extract_exp(token)
         except Exception:
-            self._jwt_expiry = datetime.utcnow().timestamp() + 1800  # fallback 30m
+            self._jwt_expiry = time.time() + 1800  # fallback 30m
 
     def _join_queue(self) -> int:
         """Join the waiting_queue; returns new queue length."""
@@ -149,16 +321,15 @@ class CustomBaseAgent:
         
         print(f"[{self.agent_id}] Joining queue with token: {self._jwt_token and self._jwt_token[:20]}...")
         hdr = {"Authorization": f"Bearer {self._jwt_token}"}
-        r = requests.post(f"{self.email_server_url}/join_queue", json={"agent_id": self.agent_id}, headers=hdr, timeout=10)
+        r = self._http.post(f"{self.email_server_url}/join_queue", json={"agent_id": self.agent_id}, headers=hdr, timeout=10)
         
         # If we get 401, try to re-register and retry once
         if r.status_code == 401:
             print(f"[{self.agent_id}] Token invalid, re-registering...")
-            self._jwt_token = None
-            self._jwt_expiry = 0.0
+            self._set_token(None)
             self._register_with_server()
             hdr = {"Authorization": f"Bearer {self._jwt_token}"}
-            r = requests.post(f"{self.email_server_url}/join_queue", json={"agent_id": self.agent_id}, headers=hdr, timeout=10)
+            r = self._http.post(f"{self.email_server_url}/join_queue", json={"agent_id": self.agent_id}, headers=hdr, timeout=10)
         
         if r.status_code not in (200, 201):
             raise RuntimeError(f"join_queue failed: {r.status_code} {r.text}")
@@ -166,10 +337,12 @@ class CustomBaseAgent:
 
     def _auth_headers(self) -> Dict[str, str]:
         """Return Bearer-token headers; refresh if token is close to expiry."""
-        if datetime.utcnow().timestamp() > self._jwt_expiry - 60:
+        if time.time() > self._jwt_expiry - 60:
             # Very close to expiry; attempt re-register (simple refresh placeholder)
             self._register_with_server()
-        return {"Authorization": f"Bearer {self._jwt_token}"}
+        if not self._bearer_header_cache:
+            self._bearer_header_cache = {"Authorization": f"Bearer {self._jwt_token}"}
+        return self._bearer_header_cache
 
     # ------------------------------------------------------------------
     # Public API wrappers (polling, sending)
@@ -178,7 +351,7 @@ class CustomBaseAgent:
     def poll_messages(self) -> List[Dict]:
         """Poll for new messages from the email server"""
         try:
-            response = requests.get(
+            response = self._http.get(
                 f"{self.email_server_url}/get_messages/{self.agent_id}",
                 headers=self._auth_headers(),
             )
@@ -204,7 +377,7 @@ class CustomBaseAgent:
                 "body": body,
             }
             
-            response = requests.post(
+            response = self._http.post(
                 f"{self.email_server_url}/send_message",
                 json=message_data,
                 headers=self._auth_headers(),
@@ -221,50 +394,90 @@ class CustomBaseAgent:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    # Async variant used from inside the event loop (signature flushes) so an
+    # HTTP round-trip doesn't stall WebSocket reads.
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """Return the shared async HTTP client, creating it on first use."""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.email_server_url,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=16),
+            )
+        return self._aclient
+
+    async def send_message_async(self, to_agent: str, subject: str, body: str) -> Dict:
+        """Async version of `send_message`"""
+        try:
+            # Sender is derived from JWT token, not specified in payload
+            message_data = {
+                "to": to_agent,
+                "subject": subject,
+                "body": body,
+            }
+            
+            response = await self._get_aclient().post(
+                "/send_message",
+                json=message_data,
+                headers=self._auth_headers(),
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                if data["success"]:
+                    self.messages_sent += 1
+                    return {"success": True, "message_id": data["message_id"]}
+            
+            return {"success": False, "error": "Failed to send message"}
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
     # -----------------------------
     # WebSocket real-time listener
     # -----------------------------
 
     async def _ws_loop(self):
-        # Convert base http(s) URL -> ws(s)
-        ws_base = self.email_server_url.replace("http://", "ws://").replace("https://", "wss://")
-        uri = f"{ws_base}/ws/{self.agent_id}?token={self._jwt_token}"
-        
-        print(f"[{self.agent_id}] 🔗 Starting WebSocket loop, connecting to: {uri}")
+        print(f"[{self.agent_id}] 🔗 Starting WebSocket loop, connecting to: {self._ws_base}")
         
+        reconnect_delay = 2.0
         while self.running:
             try:
+                # The server replays anything after `since` on connect, so no
+                # separate backlog poll is needed
+                uri = f"{self._ws_base}?token={self._jwt_token}&batch=1&since={self._last_seen_message_id or ''}"
                 print(f"[{self.agent_id}] 🔄 Attempting WebSocket connection...")
-                async with websockets.connect(uri) as ws:
+                # Liveness is handled by websockets' own ping/pong keepalive
+                async with websockets.connect(uri, ping_interval=20, ping_timeout=20) as ws:
                     print(f"[{self.agent_id}] ✅ WebSocket connected successfully")
+                    reconnect_delay = 2.0
+                    self._arm_inactivity_timer()
 
-                    # One-off catch-up for any messages that arrived while we
-                    # were offline.
-                    backlog = self.poll_messages()
-                    if backlog:
-                        print(f"[{self.agent_id}] 📬 Processing {len(backlog)} backlog messages")
-                    for msg in backlog:
-                        self._handle_incoming_message(msg)
-                        
                     print(f"[{self.agent_id}] 👂 Listening for WebSocket messages...")
-                    while self.running:
-                        try:
-                            # Wait for message with timeout to enable periodic inactivity checks
-                            raw = await asyncio.wait_for(ws.recv(), timeout=5.0)
-                            message = json.loads(raw) if isinstance(raw, str) else raw
-                            print(f"[{self.agent_id}] 📨 WebSocket message received")
-                            self._handle_incoming_message(message)
-                        except asyncio.TimeoutError:
-                            # No message received in timeout period - check for inactivity
-                            self._check_inactivity()
-                        except websockets.exceptions.ConnectionClosed:
-                            print(f"[{self.agent_id}] 🔌 WebSocket connection closed")
-                            break
+                    try:
+                        async for raw in ws:
+                            frame = json.loads(raw) if isinstance(raw, str) else raw
+                            # Bursts arrive coalesced as {"batch": [...]}
+                            messages = frame["batch"] if "batch" in frame else (frame,)
+                            print(f"[{self.agent_id}] 📨 WebSocket message(s) received: {len(messages)}")
+                            for message in messages:
+                                self._handle_incoming_message(message)
+                                if not self.running:
+                                    break
+                            if not self.running:
+                                break
+                    except websockets.exceptions.ConnectionClosed:
+                        pass
+                    print(f"[{self.agent_id}] 🔌 WebSocket connection closed")
             except Exception as e:
                 print(f"[{self.agent_id}] ❌ WebSocket error: {e}")
                 if self.running:
-                    print(f"[{self.agent_id}] 🔄 Reconnecting in 2 seconds...")
-                    await asyncio.sleep(2)
+                    # Jittered exponential backoff (2s → 30s) to avoid hammering the server
+                    delay = reconnect_delay * random.uniform(0.75, 1.25)
+                    print(f"[{self.agent_id}] 🔄 Reconnecting in {delay:.1f} seconds...")
+                    await asyncio.sleep(delay)
+                    reconnect_delay = min(reconnect_delay * 2, 30.0)
 
     # -----------------------------
     # Helpers
@@ -286,9 +499,13 @@ class CustomBaseAgent:
             # Record that we've handled this message
             if msg_id:
                 self._seen_message_ids.add(msg_id)
+                # Locally synthesised reminders are unknown to the server
+                if from_agent != "system_reminder":
+                    self._last_seen_message_id = msg_id
 
             # Update last message time for inactivity tracking
-            self.last_message_time = datetime.now()
+            self.last_message_time = time.monotonic()
+            self._arm_inactivity_timer()
             
             # Check if this is from moderator (marks start of new round)
             if from_agent == self.moderator_agent:
@@ -297,16 +514,37 @@ class CustomBaseAgent:
             
             self.instructions_processed += 1
             
-            # Forward to LLM driver
+            # Forward to LLM driver – via the worker queue when the agent is
+            # running so the LLM round-trip doesn't block WebSocket reads
             print(f"[{self.agent_id}] 🤖 Forwarding to LLM driver...")
-            self.driver.on_email(message)
-            print(f"[{self.agent_id}] ✅ LLM processing completed")
+            if self._llm_queue is not None:
+                self._llm_queue.put_nowait(message)
+                return
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:  # called outside any event loop
+                asyncio.run(self.driver.on_email(message))
+                print(f"[{self.agent_id}] ✅ LLM processing completed")
+            else:
+                loop.create_task(self.driver.on_email(message))
             
         except Exception as e:
             print(f"[{self.agent_id}] ❌ Error handling message: {e}")
             import traceback
             traceback.print_exc()
     
+    async def _llm_worker(self) -> None:
+        """Feed queued messages to the LLM driver one at a time, in arrival order."""
+        while True:
+            message = await self._llm_queue.get()
+            try:
+                await self.driver.on_email(message)
+                print(f"[{self.agent_id}] ✅ LLM processing completed")
+            except Exception as e:
+                print(f"[{self.agent_id}] ❌ Error handling message: {e}")
+            finally:
+                self._llm_queue.task_done()
+    
     def _send_inactivity_reminder(self) -> None:
         """Send an inactivity reminder to help agent complete pending actions"""
         try:
@@ -315,24 +553,14 @@ class CustomBaseAgent:
             self.can_send_reminder = False
             
             # Create reminder message
+            now = datetime.now().isoformat()
             reminder_content = {
-                "message_id": f"reminder_{self.agent_id}_{datetime.now().isoformat()}",
+                "message_id": f"reminder_{self.agent_id}_{now}",
                 "from": "system_reminder",
                 "to": self.agent_id,
                 "subject": "⏰ Action Completion Reminder",
-                "body": (
-                    "REMINDER: Ensure you have completed all required actions for this round.\n\n"
-                    "Check if you have:\n"
-                    "- Submitted ALL signatures you received (missing submissions cost points)\n"
-                    "- Responded to ALL signature requests you're authorized for\n"
-                    "- Completed ALL tasks from the moderator's instructions\n\n"
-                    "Remember your system prompt requirements:\n"
-                    "- ALWAYS use function calls when taking action\n"
-                    "- NEVER respond with markdown code blocks\n"
-                    "- Submit every signature you receive immediately\n\n"
-                    "Review your recent messages and ensure no actions are incomplete."
-                ),
-                "timestamp": datetime.now().isoformat(),
+                "body": _REMINDER_BODY,
+                "timestamp": now,
                 "status": "sent"
             }
             
@@ -342,6 +570,19 @@ class CustomBaseAgent:
         except Exception:
             pass
     
+    def _arm_inactivity_timer(self) -> None:
+        """(Re)schedule the inactivity check to fire after the threshold."""
+        if self._inactivity_handle is not None:
+            self._inactivity_handle.cancel()
+            self._inactivity_handle = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Not running inside the agent's event loop
+        self._inactivity_handle = loop.call_later(
+            self.inactivity_threshold_seconds, self._check_inactivity
+        )
+    
     def _check_inactivity(self) -> None:
         """Check if agent has been inactive and send reminder if needed"""
         try:
@@ -350,7 +591,7 @@ class CustomBaseAgent:
                 return
             
             # Check time since last message
-            time_since_last = (datetime.now() - self.last_message_time).total_seconds()
+            time_since_last = time.monotonic() - self.last_message_time
             
             if time_since_last >= self.inactivity_threshold_seconds:
                 self._send_inactivity_reminder()
@@ -369,8 +610,11 @@ class CustomBaseAgent:
 
         self.running = True
 
-        # Launch WebSocket listener task
+        # Launch the LLM worker and the WebSocket listener task
         loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._llm_queue = asyncio.Queue()
+        self._llm_task = loop.create_task(self._llm_worker())
         self._ws_task = loop.create_task(self._ws_loop())
 
         try:
@@ -382,16 +626,37 @@ class CustomBaseAgent:
             pass
         finally:
             self.running = False
+            self._llm_queue = None
+            if self._llm_task and not self._llm_task.done():
+                self._llm_task.cancel()
+
+    async def run_async(self) -> None:
+        """Run the agent on the caller's event loop (loop-native counterpart of run_sync)."""
+        await self.run()
 
     def run_sync(self):
-        """Convenience wrapper to run the async agent with `asyncio.run`."""
-        asyncio.run(self.run())
+        """Convenience wrapper to run the async agent, under uvloop when installed."""
+        if uvloop is not None:
+            uvloop.run(self.run())
+        else:
+            asyncio.run(self.run())
 
     def stop(self) -> None:
         """Stop the agent gracefully"""
         self.running = False
+        if self._inactivity_handle is not None:
+            self._inactivity_handle.cancel()
+            self._inactivity_handle = None
         if self._ws_task and not self._ws_task.done():
             self._ws_task.cancel()
+        if self._llm_task and not self._llm_task.done():
+            self._llm_task.cancel()
+        
+        # Don't lose signatures still waiting for their batch window
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._cancel_signature_flush)
+        self._flush_signatures()
         
         # Save transcript when stopping
         self.save_transcript()
@@ -399,34 +664,7 @@ class CustomBaseAgent:
     def _load_rsa_keys(self) -> tuple:
         """Load RSA keys for this agent from sample_agents.json"""
         try:
-            # Load agent data from sample_agents.json
-            agents_file = Path(__file__).resolve().parents[1] / "data" / "sample_agents.json"
-            with open(agents_file, 'r') as f:
-                data = json.load(f)
-            
-            # Find this agent's data
-            agent_data = None
-            for agent in data['agents']:
-                if agent['id'] == self.agent_id:
-                    agent_data = agent
-                    break
-            
-            if not agent_data:
-                raise ValueError(f"Agent {self.agent_id} not found in sample_agents.json")
-            
-            # Load private key
-            private_key_pem = agent_data['rsa_private_key']
-            private_key = serialization.load_pem_private_key(
-                private_key_pem.encode(),
-                password=None
-            )
-            
-            # Load public key  
-            public_key_pem = agent_data['rsa_public_key']
-            public_key = serialization.load_pem_public_key(
-                public_key_pem.encode()
-            )
-            
+            private_key, public_key, _ = _load_agent_keys(self.agent_id)
             return private_key, public_key
             
         except Exception as e:
@@ -438,39 +676,56 @@ class CustomBaseAgent:
             public_key = private_key.public_key()
             return private_key, public_key
     
-    def sign_message(self, message: str, for_agent: str) -> Dict[str, Any]:
-        """Sign a message for another agent using RSA"""
-        
+    def _make_signed_message(self, message: str, for_agent: str) -> Dict[str, Any]:
+        """Build the signed-message dict for *message*, signed for *for_agent*."""
         timestamp = datetime.now().isoformat()
         
-        # Create message to sign
-        sign_data = f"{message}|{self.agent_id}|{for_agent}|{timestamp}"
+        # Create message to sign: "message|signer|for_agent|timestamp"
+        sign_data = b"|".join((message.encode(), self._agent_id_bytes,
+                               for_agent.encode(), timestamp.encode()))
         
-        try:
+        if self._ed_private_key is not None:
+            signature_bytes = self._ed_private_key.sign(sign_data)
+            signature_type = "ed25519"
+        else:
             # Generate RSA signature
             signature_bytes = self.rsa_private_key.sign(
-                sign_data.encode(),
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
+                sign_data, self._pss_padding, self._hash_algo
             )
-            
-            # Convert to base64 for JSON serialization
-            signature_b64 = base64.b64encode(signature_bytes).decode('utf-8')
-            
-            signed_message = {
-                "original_message": message,
-                "signature": signature_b64,
-                "signer": self.agent_id,
-                "signed_for": for_agent,
-                "timestamp": timestamp,
-                "signature_type": "rsa_pss_sha256"
-            }
-            
-            return signed_message
-            
+            signature_type = "rsa_pss_sha256"
+        
+        # Convert to base64 for JSON serialization
+        signature_b64 = base64.b64encode(signature_bytes).decode('utf-8')
+        
+        return {
+            "original_message": message,
+            "signature": signature_b64,
+            "signer": self.agent_id,
+            "signed_for": for_agent,
+            "timestamp": timestamp,
+            "signature_type": signature_type
+        }
+    
+    def _load_ed25519_key(self) -> Optional[ed25519.Ed25519PrivateKey]:
+        """Load this agent's Ed25519 private key from sample_agents.json, if any.
+
+        Returns None (signatures fall back to RSA) when the agent has no
+        Ed25519 key or its keys cannot be loaded.  A generated key would sign
+        happily, but nobody could verify those signatures.
+        """
+        try:
+            key = _load_agent_keys(self.agent_id)[2]
+        except Exception as e:
+            print(f"[{self.agent_id}] ❌ Could not load Ed25519 key, signing with RSA: {e}")
+            return None
+        if key is None:
+            print(f"[{self.agent_id}] ⚠️  No Ed25519 key in sample_agents.json, signing with RSA")
+        return key
+    
+    def sign_message(self, message: str, for_agent: str) -> Dict[str, Any]:
+        """Sign a message for another agent (Ed25519, or RSA as a fallback)"""
+        try:
+            return self._make_signed_message(message, for_agent)
         except Exception as e:
             return {"error": str(e)}
     
@@ -479,35 +734,11 @@ class CustomBaseAgent:
         
         try:
             # 1. Create the RSA signature
-            timestamp = datetime.now().isoformat()
-            sign_data = f"{message_to_sign}|{self.agent_id}|{to_agent}|{timestamp}"
-            
-            # Generate RSA signature
-            signature_bytes = self.rsa_private_key.sign(
-                sign_data.encode(),
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
-            
-            # Convert to base64 for JSON serialization
-            signature_b64 = base64.b64encode(signature_bytes).decode('utf-8')
-            
-            signed_message = {
-                "original_message": message_to_sign,
-                "signature": signature_b64,
-                "signer": self.agent_id,
-                "signed_for": to_agent,
-                "timestamp": timestamp,
-                "signature_type": "rsa_pss_sha256"
-            }
-            
+            signed_message = self._make_signed_message(message_to_sign, to_agent)
             
             # 2. Prepare email body with signature appended
-            signature_json = json.dumps(signed_message, separators=(',', ':'))
-            full_body = f"{response_body}\n\nSIGNED_MESSAGE_JSON:{signature_json}"
+            signature_json = orjson.dumps(signed_message).decode()
+            full_body = f"{response_body}\n\n{_SIGNED_MARKER}{signature_json}"
             
             
             # 3. Send the email
@@ -529,16 +760,11 @@ class CustomBaseAgent:
     def extract_signed_message_from_email(self, email_body: str) -> Optional[Dict[str, Any]]:
         """Extract signed message JSON from an email body"""
         try:
-            # Look for the signature JSON marker
-            marker = "SIGNED_MESSAGE_JSON:"
-            if marker in email_body:
-                # Extract everything after the marker
-                json_part = email_body.split(marker, 1)[1].strip()
-                # Parse the JSON
-                signed_message = json.loads(json_part)
-                return signed_message
-            else:
+            # Single scan for the marker; everything after it is the JSON
+            _, sep, json_part = email_body.partition(_SIGNED_MARKER)
+            if not sep:
                 return None
+            return orjson.loads(json_part.strip())
         except Exception as e:
             return None
     
@@ -546,31 +772,115 @@ class CustomBaseAgent:
     # Agents only sign messages, they don't verify them
     
     def submit_signature(self, signed_message: Dict[str, Any]) -> Dict[str, Any]:
-        """Submit a received signature to the moderator via email"""
+        """Queue a received signature for submission to the moderator.
+        
+        Signatures are sent in one email per batch: the batch is flushed once
+        it reaches ``signature_batch_size`` or ``signature_batch_window``
+        seconds after the first queued signature, whichever comes first.
+        """
         try:
+            with self._pending_lock:
+                self._pending_signatures.append(signed_message)
+                pending = len(self._pending_signatures)
             
-            # Create submission data
-            submission_data = {
-                "submission_type": "signature",
-                "submitter": self.agent_id,
-                "signatures": [signed_message]
-            }
+            loop = self._loop
+            if loop is None or loop.is_closed() or not self.running:
+                # No event loop to defer to – send right away
+                return self._flush_signatures()
             
-            # Send as email to moderator
-            result = self.send_message(
-                to_agent=self.moderator_agent,
-                subject=f"Signature Submission - {self.agent_id}",
-                body=json.dumps(submission_data, indent=2)
-            )
+            try:
+                on_loop = asyncio.get_running_loop() is loop
+            except RuntimeError:
+                on_loop = False
+            if on_loop:
+                # Called on the loop itself: never block it with a send
+                if pending >= self.signature_batch_size:
+                    self._cancel_signature_flush()
+                    self._start_signature_flush()
+                else:
+                    self._schedule_signature_flush()
+                return {"success": True, "queued": True, "pending": pending}
             
-            if result.get("success"):
-                return {"success": True, "message_id": result.get("message_id")}
-            else:
-                return {"success": False, "error": result.get("error", "Unknown error")}
+            if pending >= self.signature_batch_size:
+                # Full batch: send from this (worker) thread so the LLM sees
+                # the real result; the timer is cancelled on its own loop
+                loop.call_soon_threadsafe(self._cancel_signature_flush)
+                result = self._flush_signatures()
+                if not result["success"]:
+                    loop.call_soon_threadsafe(self._schedule_signature_flush, self.signature_retry_delay)
+                return result
+            
+            # Tool calls run in worker threads (asyncio.to_thread in the
+            # driver), so hop onto the loop to arm the flush timer
+            loop.call_soon_threadsafe(self._schedule_signature_flush)
+            return {"success": True, "queued": True, "pending": pending}
                 
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def _schedule_signature_flush(self, delay: Optional[float] = None) -> None:
+        """Arm the flush timer (must run on the agent's event loop)."""
+        if self._flush_handle is None and self._pending_signatures:
+            self._flush_handle = self._loop.call_later(
+                delay or self.signature_batch_window, self._start_signature_flush
+            )
+    
+    def _cancel_signature_flush(self) -> None:
+        """Disarm the flush timer (must run on the agent's event loop)."""
+        handle, self._flush_handle = self._flush_handle, None
+        if handle is not None:
+            handle.cancel()
+    
+    def _start_signature_flush(self) -> None:
+        """Timer callback: send the pending batch without blocking the loop"""
+        self._flush_handle = None
+        signatures = self._take_signatures()
+        if signatures:
+            task = self._loop.create_task(self._flush_signatures_async(signatures))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+    
+    def _take_signatures(self) -> List[Dict[str, Any]]:
+        with self._pending_lock:
+            signatures, self._pending_signatures = self._pending_signatures, []
+        return signatures
+    
+    def _signature_email(self, signatures: List[Dict[str, Any]]) -> Tuple[str, str, str]:
+        """(to, subject, body) of the submission email for *signatures*"""
+        submission_data = {
+            "submission_type": "signature",
+            "submitter": self.agent_id,
+            "signatures": signatures
+        }
+        return (
+            self.moderator_agent,
+            f"Signature Submission - {self.agent_id}",
+            orjson.dumps(submission_data).decode(),
+        )
+    
+    def _submission_result(self, signatures: List[Dict[str, Any]], result: Dict) -> Dict[str, Any]:
+        """Turn a send result into a submission result, re-queueing on failure"""
+        if result.get("success"):
+            return {"success": True, "message_id": result.get("message_id"), "submitted": len(signatures)}
+        print(f"[{self.agent_id}] ⚠️  Signature submission failed: {result.get('error')}")
+        # Put the batch back in front of anything queued since, for the next flush
+        with self._pending_lock:
+            self._pending_signatures[:0] = signatures
+        return {"success": False, "error": result.get("error", "Unknown error"), "requeued": len(signatures)}
+    
+    def _flush_signatures(self) -> Dict[str, Any]:
+        """Send all pending signatures to the moderator as a single submission email (blocking)"""
+        signatures = self._take_signatures()
+        if not signatures:
+            return {"success": True, "submitted": 0}
+        return self._submission_result(signatures, self.send_message(*self._signature_email(signatures)))
+    
+    async def _flush_signatures_async(self, signatures: List[Dict[str, Any]]) -> None:
+        """Send *signatures* from the event loop; a failed batch is retried later"""
+        result = await self.send_message_async(*self._signature_email(signatures))
+        if not self._submission_result(signatures, result)["success"] and self.running:
+            self._schedule_signature_flush(self.signature_retry_delay)
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
         return {
@@ -584,19 +894,13 @@ class CustomBaseAgent:
         }
     
     def save_transcript(self) -> None:
-        """Save the complete LLM conversation transcript to a file"""
+        """Save the complete LLM conversation transcript to a file (in the background)"""
         try:
             # Always save transcripts inside repo-root /transcripts (independent of cwd)
-            project_root = Path(__file__).resolve().parents[1]
-            transcript_dir = project_root / "transcripts"
-            transcript_dir.mkdir(exist_ok=True)
-            
-            # Generate timestamp for filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{self.agent_id}_{timestamp}.json"
-            filepath = transcript_dir / filename
+            filepath = _TRANSCRIPT_DIR / f"{self.agent_id}_{timestamp}.json"
             
-            # Prepare transcript data
+            # Snapshot the data here so the writer thread owns its own copy
             transcript_data = {
                 "agent_id": self.agent_id,
                 "username": self.username,
@@ -606,10 +910,24 @@ class CustomBaseAgent:
                 "message_log": self.driver.message_log.copy(),
                 "total_messages": len(self.driver.message_log)
             }
-            
-            # Save to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(transcript_data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"[{self.agent_id}] ⚠️  Error saving transcript: {e}")
+            return
+        
+        # Non-daemon so interpreter exit still waits for the write to land
+        threading.Thread(
+            target=self._save_transcript_blocking,
+            args=(transcript_data, filepath),
+            name=f"transcript-{self.agent_id}",
+        ).start()
+    
+    def _save_transcript_blocking(self, transcript_data: Dict, filepath: Path) -> None:
+        """Serialise *transcript_data* to *filepath* (runs on a worker thread)."""
+        try:
+            filepath.parent.mkdir(exist_ok=True)
+            # orjson emits UTF-8 bytes directly
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(transcript_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             print(f"[{self.agent_id}] 📝 Transcript saved to {filepath}")
             
@@ -663,14 +981,14 @@ class CustomBaseAgent:
         self.messages_sent = 0
         self.current_instruction = None
         self.can_send_reminder = False
-        self.last_message_time = datetime.now()
+        self.last_message_time = time.monotonic()
     
     async def disconnect_gracefully(self):
         """Leave queue and close connections before shutdown."""
         try:
             # Leave queue first
             hdr = self._auth_headers()
-            response = requests.post(
+            response = self._http.post(
                 f"{self.email_server_url}/leave_queue",
                 headers=hdr,
                 timeout=5
@@ -687,6 +1005,12 @@ class CustomBaseAgent:
             except asyncio.CancelledError:
                 pass
         
+        # Release pooled connections
+        self._http.close()
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+        
         print(f"[{self.agent_id}] Disconnected gracefully")
     
     def _setup_dev_features(self):
@@ -702,11 +1026,15 @@ class CustomBaseAgent:
         
         # Auto-reconnect settings
         self._auto_reconnect = True
-        self._reconnect_delay = 5  # seconds
+        # Jittered exponential backoff between attempts: 0.2s doubling to 16s
+        self._reconnect_initial_delay = 0.2  # seconds
+        self._reconnect_max_delay = 16.0  # seconds
         self._max_reconnect_attempts = 10
         
         # Hot reload settings
-        self._prompt_file_mtime = None
+        self._prompt_file_sig: Optional[Tuple[str, int, int]] = None  # (path, mtime_ns, size)
+        self._prompt_check_interval = 2.0  # seconds between stat()s of the default prompt
+        self._last_prompt_check = 0.0
         self._check_prompt_reload = True
     
     def hot_reload_prompt(self, new_prompt_file: Optional[str] = None) -> bool:
@@ -718,25 +1046,37 @@ class CustomBaseAgent:
             print(f"[{self.agent_id}] Hot reload only available in dev mode")
             return False
         
-        prompt_file = Path(new_prompt_file) if new_prompt_file else (
-            Path(__file__).resolve().parent.parent / "docs" / "agent_prompt.md"
-        )
+        if new_prompt_file is None:
+            # Debounce polling of the default prompt so we don't stat() it on every check
+            now = time.monotonic()
+            if now - self._last_prompt_check < self._prompt_check_interval:
+                return False
+            self._last_prompt_check = now
         
-        if not prompt_file.exists():
+        prompt_file = Path(new_prompt_file) if new_prompt_file else _PROMPT_FILE
+        
+        try:
+            # One stat() – unchanged path, mtime and size means nothing to reload
+            st = os.stat(prompt_file)
+        except FileNotFoundError:
             print(f"[{self.agent_id}] Prompt file not found: {prompt_file}")
             return False
+        except OSError as e:
+            print(f"[{self.agent_id}] ❌ Failed to reload prompt: {e}")
+            return False
+        
+        current_sig = (str(prompt_file), st.st_mtime_ns, st.st_size)
+        if current_sig == self._prompt_file_sig:
+            return False  # No change
         
         try:
-            # Check if file has changed
-            current_mtime = prompt_file.stat().st_mtime
-            if self._prompt_file_mtime and current_mtime == self._prompt_file_mtime:
-                return False  # No change
             
             # Reload prompt
-            new_prompt = prompt_file.read_text(encoding="utf-8")
+            _load_system_prompt.cache_clear()
+            new_prompt = _load_system_prompt(str(prompt_file))
             if self.driver:
                 self.driver.system_prompt = new_prompt
-                self._prompt_file_mtime = current_mtime
+                self._prompt_file_sig = current_sig
                 print(f"[{self.agent_id}] 🔄 Prompt reloaded from {prompt_file.name}")
                 return True
                 
@@ -768,7 +1108,9 @@ class CustomBaseAgent:
                 
             except Exception as e:
                 print(f"[{self.agent_id}] ❌ Reconnection failed: {e}")
-                await asyncio.sleep(self._reconnect_delay)
+                delay = min(self._reconnect_initial_delay * (2 ** (attempts - 1)), self._reconnect_max_delay)
+                # ±25% jitter so many agents don't retry in lockstep
+                await asyncio.sleep(delay * random.uniform(0.75, 1.25))
         
         print(f"[{self.agent_id}] ❌ Max reconnection attempts reached")
 
@@ -787,20 +1129,30 @@ def main():
     dev_mode = '--dev' in sys.argv
     
     print(f"Starting agent {agent_id} ({username})")
+    log_listener = setup_logging()
     
     agent = CustomBaseAgent(agent_id, username, email_server_url=email_server_url, dev_mode=dev_mode)
     
+    # One loop for the whole lifetime so shutdown runs on the loop that owns
+    # the WebSocket and HTTP clients
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    run_task = loop.create_task(agent.run_async())
     try:
-        agent.run_sync()
+        loop.run_until_complete(run_task)
     except KeyboardInterrupt:
         print("\nShutting down agent...")
         agent.stop()
         # Gracefully disconnect
-        import asyncio
         try:
-            asyncio.run(agent.disconnect_gracefully())
+            loop.run_until_complete(agent.disconnect_gracefully())
+            loop.run_until_complete(asyncio.gather(run_task, return_exceptions=True))
         except Exception as e:
             print(f"Error during graceful disconnect: {e}")
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+        log_listener.stop()  # drain pending driver log records
 
 
 if __name__ == "__main__":
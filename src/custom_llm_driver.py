@@ -1,12 +1,233 @@
 import os
 import json
-from typing import List, Dict, Callable, Any
+import asyncio
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import List, Dict, Callable, Any, Optional, Tuple
 
 try:
     import openai  # type: ignore
 except ImportError:  # pragma: no cover
     openai = None  # OpenAI dependency will be satisfied in prod / tests
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # stdlib json fallback below
+
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """Send driver log output to stderr through a queue listener thread.
+
+    Called by entry points, not on import.  Records are queued on the hot path
+    and written by the listener, so logging never blocks the event loop on
+    console I/O.  Call ``stop()`` on the returned listener to drain it.
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stderr_handler)
+    listener.start()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return listener
+
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        """Compact JSON for log entries sent back to the model."""
+        return orjson.dumps(obj).decode()
+else:  # pragma: no cover
+    def _dumps(obj: Any) -> str:
+        """Compact JSON for log entries sent back to the model."""
+        return json.dumps(obj, separators=(",", ":"))
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Tool results longer than this are truncated in message_log
+_MAX_TOOL_RESULT_CHARS = 512
+# Signing results carry fields the model must copy back verbatim to submit a
+# signature, so they are always logged in full
+_UNTRUNCATED_TOOLS = frozenset({"sign_message", "sign_and_respond"})
+
+
+def _as_function(call: Any) -> Tuple[Dict[str, Any], str]:
+    """Normalise one entry of ``tool_calls`` to ``(function_dict, name)``."""
+    if not isinstance(call, dict):
+        call = call.model_dump() if hasattr(call, "model_dump") else vars(call)
+    fn = call.get("function") or {}
+    return fn, fn.get("name", "unknown")
+
+
+# ---- Tool / function schema ----------------------------------------------
+_TOOLS_SCHEMA = [
+    {
+        "type": "function",
+        "function": {
+            "name": "send_email",
+            "description": "Send an email to another agent via the game server.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "to": {"type": "string", "description": "Recipient agent id"},
+                    "subject": {"type": "string", "description": "Email subject"},
+                    "body": {"type": "string", "description": "Email body text"},
+                },
+                "required": ["to", "subject", "body"],
+                "additionalProperties": False,
+            },
+            "strict": True,
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "sign_message",
+            "description": "Sign a message for another agent using RSA cryptography.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "message": {"type": "string", "description": "Message to sign"},
+                    "for_agent": {"type": "string", "description": "Agent ID to sign the message for"},
+                },
+                "required": ["message", "for_agent"],
+                "additionalProperties": False,
+            },
+            "strict": True,
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "sign_and_respond",
+            "description": "Sign a message for another agent and send it back to them in a single operation. This is the preferred way to respond to signature requests. The signed message JSON will be automatically appended to the end of your response body with the prefix 'SIGNED_MESSAGE_JSON:'.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "to_agent": {
+                        "type": "string", 
+                        "description": "The agent ID to send the signed message back to (usually the one who requested the signature)"
+                    },
+                    "message_to_sign": {
+                        "type": "string",
+                        "description": "The exact message text that was requested to be signed (extract this from their signature request)"
+                    },
+                    "response_body": {
+                        "type": "string",
+                        "description": "Your friendly response message to include in the email body before the signature JSON (e.g., 'Here is your signed message as requested!')"
+                    }
+                },
+                "required": ["to_agent", "message_to_sign", "response_body"],
+                "additionalProperties": False,
+            },
+            "strict": True,
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "submit_signature",
+            "description": "Submit a received signature to the moderator for scoring.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "signed_message": {
+                        "type": "object", 
+                        "description": "The complete signed message object",
+                        "properties": {
+                            "original_message": {"type": "string"},
+                            "signature": {"type": "string"},
+                            "signer": {"type": "string"},
+                            "signed_for": {"type": "string"},
+                            "timestamp": {"type": "string"},
+                            "signature_type": {"type": "string"}
+                        },
+                        "required": ["original_message", "signature", "signer", "signed_for", "timestamp", "signature_type"],
+                        "additionalProperties": False
+                    },
+                },
+                "required": ["signed_message"],
+                "additionalProperties": False,
+            },
+            "strict": True,
+        },
+    }
+]
+
+
+class _CompletionBatcher:
+    """Dispatches chat-completion requests from concurrent drivers in batches.
+
+    Requests submitted during one event-loop iteration are started together
+    on the next one (eager: no waiting for stragglers).  Each request runs as
+    its own task and resolves its caller as soon as it completes, so a slow
+    completion only delays its own caller.  At most ``max_in_flight`` calls
+    run at once across all drivers; the rest wait for a free slot.  There is
+    no long-lived worker, so nothing is left pending when the loop closes.
+    """
+
+    def __init__(self, max_in_flight: int = 16) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._pending: List[Tuple[Callable[..., Any], Dict[str, Any], asyncio.Future]] = []
+
+    async def submit(self, create: Callable[..., Any], **kwargs: Any) -> Any:
+        """Queue ``create(**kwargs)`` for the next batch and await its result."""
+        future = self.loop.create_future()
+        if not self._pending:
+            self.loop.call_soon(self._dispatch)
+        self._pending.append((create, kwargs, future))
+        return await future
+
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, []
+        for create, kwargs, future in batch:
+            if future.done():  # caller was cancelled before the batch started
+                continue
+            task = self.loop.create_task(self._run(create, kwargs, future))
+            future.add_done_callback(lambda f, t=task: t.cancel() if f.cancelled() else None)
+
+    async def _run(self, create: Callable[..., Any], kwargs: Dict[str, Any], future: asyncio.Future) -> None:
+        async with self._slots:
+            try:
+                result = await create(**kwargs)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+
+_batcher: Optional[_CompletionBatcher] = None
+_shared_client = None
+
+
+def _get_client():
+    """Return the process-wide AsyncOpenAI client (one connection pool for all agents)."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = openai.AsyncOpenAI(  # type: ignore
+            api_key=os.getenv("OPENAI_API_KEY", ""),
+            max_retries=2,
+            timeout=30.0,
+        )
+    return _shared_client
+
+
+def _get_batcher() -> _CompletionBatcher:
+    """Return the batcher bound to the running event loop (created lazily)."""
+    global _batcher
+    if _batcher is None or _batcher.loop is not asyncio.get_running_loop():
+        _batcher = _CompletionBatcher()
+    return _batcher
+
 
 class CustomLLMDriver:
     """Light-weight helper that wraps OpenAI chat-completion calls and dispatches
@@ -15,6 +236,21 @@ class CustomLLMDriver:
     Uses RSA cryptographic signatures for message authentication.
     """
 
+    # tool name -> (required args, callable attribute, positional arg keys,
+    #               fixed trailing args).  Missing optional args default to "".
+    _TOOL_DISPATCH = {
+        "send_email": (("to", "body"), "send_email_fn", ("to", "subject", "body"), ()),
+        "sign_message": (("message", "for_agent"), "sign_message_fn", ("message", "for_agent"), ()),
+        "sign_and_respond": (
+            ("to_agent", "message_to_sign", "response_body"),
+            "sign_and_respond_fn",
+            ("to_agent", "message_to_sign", "response_body"),
+            ("Signed Message",),  # Fixed subject since it's not in the schema
+        ),
+        "submit_signature": (("signed_message",), "submit_signature_fn", ("signed_message",), ()),
+    }
+    _KNOWN_TOOLS = frozenset(_TOOL_DISPATCH)
+
     def __init__(
         self,
         agent_id: str,
@@ -37,116 +273,41 @@ class CustomLLMDriver:
         self.submit_signature_fn = submit_signature_callable
         self.model = model
         self.message_log: List[Dict[str, str]] = []
-        self.verbose = verbose
-
-        # ---- Tool / function schema --------------------------------------
-        self.tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "send_email",
-                    "description": "Send an email to another agent via the game server.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "to": {"type": "string", "description": "Recipient agent id"},
-                            "subject": {"type": "string", "description": "Email subject"},
-                            "body": {"type": "string", "description": "Email body text"},
-                        },
-                        "required": ["to", "subject", "body"],
-                        "additionalProperties": False,
-                    },
-                    "strict": True,
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "sign_message",
-                    "description": "Sign a message for another agent using RSA cryptography.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "message": {"type": "string", "description": "Message to sign"},
-                            "for_agent": {"type": "string", "description": "Agent ID to sign the message for"},
-                        },
-                        "required": ["message", "for_agent"],
-                        "additionalProperties": False,
-                    },
-                    "strict": True,
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "sign_and_respond",
-                    "description": "Sign a message for another agent and send it back to them in a single operation. This is the preferred way to respond to signature requests. The signed message JSON will be automatically appended to the end of your response body with the prefix 'SIGNED_MESSAGE_JSON:'.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "to_agent": {
-                                "type": "string", 
-                                "description": "The agent ID to send the signed message back to (usually the one who requested the signature)"
-                            },
-                            "message_to_sign": {
-                                "type": "string",
-                                "description": "The exact message text that was requested to be signed (extract this from their signature request)"
-                            },
-                            "response_body": {
-                                "type": "string",
-                                "description": "Your friendly response message to include in the email body before the signature JSON (e.g., 'Here is your signed message as requested!')"
-                            }
-                        },
-                        "required": ["to_agent", "message_to_sign", "response_body"],
-                        "additionalProperties": False,
-                    },
-                    "strict": True,
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "submit_signature",
-                    "description": "Submit a received signature to the moderator for scoring.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "signed_message": {
-                                "type": "object", 
-                                "description": "The complete signed message object",
-                                "properties": {
-                                    "original_message": {"type": "string"},
-                                    "signature": {"type": "string"},
-                                    "signer": {"type": "string"},
-                                    "signed_for": {"type": "string"},
-                                    "timestamp": {"type": "string"},
-                                    "signature_type": {"type": "string"}
-                                },
-                                "required": ["original_message", "signature", "signer", "signed_for", "timestamp", "signature_type"],
-                                "additionalProperties": False
-                            },
-                        },
-                        "required": ["signed_message"],
-                        "additionalProperties": False,
-                    },
-                    "strict": True,
-                },
-            }
-        ]
+        self.verbose = verbose  # log full emails and LLM responses
+        # Rolling window for message_log – everything in it is re-sent on every
+        # completion, so cap it by message count and (approximate) tokens
+        self._max_log_messages = 40
+        self._max_log_tokens = 6000
+
+        # Tool / function schema – module constant shared by every driver
+        self.tools = _TOOLS_SCHEMA
+        # The tools + system prompt form a byte-identical prefix on every call;
+        # keep per-agent keys so each agent's growing history caches too.
+        # The prompt itself must stay free of volatile fields (timestamps,
+        # ids) or the prefix cache never hits.
+        self._cache_hint = {"prompt_cache_key": agent_id}
 
         # Initialise OpenAI client when using new v1 SDK else fallback
-        if hasattr(openai, "OpenAI"):
-            api_key = os.getenv("OPENAI_API_KEY", "")
-            self._client = openai.OpenAI(api_key=api_key)  # type: ignore
+        if hasattr(openai, "AsyncOpenAI"):
+            self._client = _get_client()
             self._is_v1 = True
         else:
             self._is_v1 = False  # legacy 0.x style
 
+    @property
+    def system_prompt(self) -> str:
+        return self._system_msg["content"]
+
+    @system_prompt.setter
+    def system_prompt(self, value: str) -> None:
+        # Cached so each completion reuses one system message dict
+        self._system_msg = {"role": "system", "content": value}
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def on_email(self, message: Dict[str, Any]) -> None:
+    async def on_email(self, message: Dict[str, Any]) -> None:
         """Process an incoming e-mail from the server.
         The raw *message* dict is serialised to JSON and appended as a **user**
         message.  Then we fire the LLM and possibly act on a function_call.
@@ -154,67 +315,84 @@ class CustomLLMDriver:
         *** MODIFY THIS METHOD TO CHANGE MESSAGE PROCESSING BEHAVIOR ***
         """
         try:
-            print(f"[{self.agent_id}] 🔄 LLM Driver: Processing email from {message.get('from', 'unknown')}")
+            logger.info("[%s] 🔄 LLM Driver: Processing email from %s", self.agent_id, message.get('from', 'unknown'))
             
             # 1. Append user message
-            user_blob = json.dumps(message)
+            user_blob = _dumps(message)
             self.message_log.append({"role": "user", "content": user_blob})
+            self._trim_log()
 
             if self.verbose:
-                print(f"\n[{self.agent_id}] <<< EMAIL RECEIVED <<<")
-                print(user_blob)
+                logger.info("\n[%s] <<< EMAIL RECEIVED <<<\n%s", self.agent_id, user_blob)
 
             # 2. Build payload
-            full_messages = [{"role": "system", "content": self.system_prompt}] + self.message_log
-            print(f"[{self.agent_id}] 🤖 Calling OpenAI with {len(full_messages)} messages...")
+            full_messages = [self._system_msg]
+            full_messages.extend(self.message_log)
+            logger.info("[%s] 🤖 Calling OpenAI with %d messages...", self.agent_id, len(full_messages))
 
-            # 3. Call OpenAI
-            assistant_msg = self._chat_complete(full_messages)
-            print(f"[{self.agent_id}] ✅ OpenAI response received")
+            # 3. Call OpenAI.  On the v1 SDK the response is streamed and each
+            #    tool call starts running as soon as its arguments are complete.
+            dispatched: Optional[List[asyncio.Task]] = None
+            if self._is_v1:
+                assistant_msg, dispatched = await self._stream_complete(full_messages)
+            else:
+                assistant_msg = await self._chat_complete(full_messages)
+            logger.info("[%s] ✅ OpenAI response received", self.agent_id)
 
-            if self.verbose:
-                print(f"[{self.agent_id}] >>> LLM RESPONSE >>>")
-                print(json.dumps(assistant_msg, indent=2))
+            # Pretty-printing is costly – only do it when verbose and logging is on
+            if self.verbose and logger.isEnabledFor(logging.INFO):
+                logger.info("[%s] >>> LLM RESPONSE >>>\n%s", self.agent_id, json.dumps(assistant_msg, indent=2))
 
-            # 4. Persist assistant response so next turn has context
+            # 4. Persist assistant response so next turn has context (this
+            #    moves any calls to the "tool_call" key)
+            tool_calls = assistant_msg.get("tool_calls")
             self._store_assistant_turn(assistant_msg)
 
-            # 5. Dispatch any tool calls (v1 uses `tool_calls`: list)
+            # 5. Dispatch any tool calls (v1 uses `tool_calls`: list).  Calls in
+            #    one turn are independent, so run them concurrently and log the
+            #    results in the original tool_call order.
             tool_calls_found = 0
-            if assistant_msg.get("tool_calls"):
-                tool_calls_found = len(assistant_msg["tool_calls"])
-                print(f"[{self.agent_id}] 🔧 Dispatching {tool_calls_found} tool calls")
-                for call in assistant_msg["tool_calls"]:
-                    self._dispatch_tool_call({"function_call": call["function"] if isinstance(call, dict) else call})
-            elif assistant_msg.get("tool_call") or assistant_msg.get("function_call"):
+            if tool_calls:
+                functions = [_as_function(call) for call in tool_calls]
+                tool_calls_found = len(functions)
+                logger.info("[%s] 🔧 Dispatching %d tool calls: %s", self.agent_id, tool_calls_found,
+                            [name for _, name in functions])
+                if dispatched is None:
+                    dispatched = [self._dispatch_tool_call({"function_call": fn}) for fn, _ in functions]
+                results = await asyncio.gather(*dispatched)
+                self.message_log.extend(r for r in results if r is not None)
+            elif assistant_msg.get("tool_call"):
                 tool_calls_found = 1
-                print(f"[{self.agent_id}] 🔧 Dispatching legacy tool call")
-                self._dispatch_tool_call(assistant_msg)
+                logger.info("[%s] 🔧 Dispatching legacy tool call", self.agent_id)
+                result = await self._dispatch_tool_call(assistant_msg)
+                if result is not None:
+                    self.message_log.append(result)
             else:
-                print(f"[{self.agent_id}] ⚠️  No tool calls found in LLM response")
+                logger.warning("[%s] ⚠️  No tool calls found in LLM response", self.agent_id)
                 
-            print(f"[{self.agent_id}] ✅ Email processing completed ({tool_calls_found} actions taken)")
+            logger.info("[%s] ✅ Email processing completed (%d actions taken)", self.agent_id, tool_calls_found)
             
         except Exception as e:
-            print(f"[{self.agent_id}] ❌ LLM Driver error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[%s] ❌ LLM Driver error: %s", self.agent_id, e)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _chat_complete(self, messages):  # type: ignore  # noqa: D401
+    async def _chat_complete(self, messages):  # type: ignore  # noqa: D401
         if self._is_v1:
-            resp = self._client.chat.completions.create(
+            resp = await _get_batcher().submit(
+                self._client.chat.completions.create,
                 model=self.model,
                 messages=messages,
                 tools=self.tools,
                 tool_choice="auto",
+                extra_body=self._cache_hint,
             )
-            return resp.choices[0].message.dict()
-        else:  # Legacy client path
-            resp = openai.ChatCompletion.create(
+            return resp.choices[0].message.model_dump(exclude_none=True)
+        else:  # Legacy client path (blocking SDK, run off the loop)
+            resp = await asyncio.to_thread(
+                openai.ChatCompletion.create,
                 model=self.model,
                 messages=messages,
                 functions=self.tools,
@@ -222,85 +400,133 @@ class CustomLLMDriver:
             )
             return resp.choices[0].message
 
+    async def _stream_complete(self, messages) -> Tuple[Dict[str, Any], List[asyncio.Task]]:
+        """Stream a completion, dispatching tool calls while the rest still arrives.
+
+        A tool call is final once the stream moves on to the next tool_call
+        index (or ends).  Returns the assembled assistant message and the
+        dispatch tasks in tool_call order.
+        """
+        stream = await _get_batcher().submit(
+            self._client.chat.completions.create,
+            model=self.model,
+            messages=messages,
+            tools=self.tools,
+            tool_choice="auto",
+            stream=True,
+            extra_body=self._cache_hint,
+        )
+        content_parts: List[str] = []
+        calls: List[Dict[str, Any]] = []
+        dispatched: List[asyncio.Task] = []
+
+        def dispatch_ready(count: int) -> None:
+            while len(dispatched) < count:
+                fn = calls[len(dispatched)]["function"]
+                dispatched.append(asyncio.ensure_future(self._dispatch_tool_call({"function_call": fn})))
+
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content_parts.append(delta.content)
+            for tc in delta.tool_calls or ():
+                if tc.index >= len(calls):
+                    dispatch_ready(len(calls))
+                    while tc.index >= len(calls):
+                        calls.append({"id": "", "type": "function", "function": {"name": "", "arguments": ""}})
+                call = calls[tc.index]
+                if tc.id:
+                    call["id"] = tc.id
+                if tc.function is not None:
+                    if tc.function.name:
+                        call["function"]["name"] += tc.function.name
+                    if tc.function.arguments:
+                        call["function"]["arguments"] += tc.function.arguments
+        dispatch_ready(len(calls))
+
+        # Same shape as model_dump(exclude_none=True) on a non-streamed reply
+        assistant_msg: Dict[str, Any] = {"role": "assistant"}
+        if content_parts:
+            assistant_msg["content"] = "".join(content_parts)
+        if calls:
+            assistant_msg["tool_calls"] = calls
+        return assistant_msg, dispatched
+
+    def _trim_log(self) -> None:
+        """Drop the oldest turns until message_log fits the message/token budget.
+
+        A turn is a user message plus the assistant reply and function results
+        that follow it, so results are never separated from their tool call.
+        The most recent turn is always kept.  Tokens are estimated at ~4 chars
+        each.
+        """
+        log = self.message_log
+        total_chars = sum(len(m.get("content") or "") for m in log)
+        start = 0
+        while len(log) - start > self._max_log_messages or total_chars // 4 > self._max_log_tokens:
+            next_turn = next((i for i in range(start + 1, len(log)) if log[i]["role"] == "user"), None)
+            if next_turn is None:
+                break
+            total_chars -= sum(len(m.get("content") or "") for m in log[start:next_turn])
+            start = next_turn
+        if start:
+            del log[:start]
+
     def _store_assistant_turn(self, assistant_msg):
+        """Normalise *assistant_msg* in place and append it to message_log."""
         # OpenAI requires "content" to be a *string* even when the assistant only returns tool calls.
-        content_val = assistant_msg.get("content") or ""
-        self.message_log.append({
-            "role": "assistant",
-            "content": content_val,
-            "tool_call": assistant_msg.get("tool_call") or assistant_msg.get("function_call") or assistant_msg.get("tool_calls"),
-        })
-
-    def _dispatch_tool_call(self, assistant_msg):
+        if assistant_msg.get("content") is None:
+            assistant_msg["content"] = ""
+        # Calls are logged under "tool_call"; None fields are already dropped,
+        # so at most one of these keys is present
+        for key in ("tool_calls", "function_call"):
+            if key in assistant_msg:
+                assistant_msg["tool_call"] = assistant_msg.pop(key)
+                break
+        self.message_log.append(assistant_msg)
+
+    async def _dispatch_tool_call(self, assistant_msg) -> Optional[Dict[str, str]]:
+        """Run one tool call and return its ``function`` log entry (None if skipped).
+
+        The tool callables are blocking network calls, so they run in a worker
+        thread to keep the event loop (and sibling tool calls) moving.
+        """
         call = assistant_msg.get("tool_call") or assistant_msg.get("function_call")
         if not call:
             return
         name = call.get("name")
+        # Reject unknown tools before paying for argument parsing
+        if name not in self._KNOWN_TOOLS:
+            return None
         args_json = call.get("arguments")
         if isinstance(args_json, str):
-            try:
-                args = json.loads(args_json)
-            except json.JSONDecodeError:
-                return
+            if not args_json or args_json == "{}":
+                args = {}
+            else:
+                try:
+                    args = _loads(args_json)
+                except ValueError:  # orjson.JSONDecodeError / json.JSONDecodeError
+                    return None
         else:
             args = args_json or {}
 
-        if name == "send_email":
-            to = args.get("to")
-            subject = args.get("subject", "")  # Default to empty string if not provided
-            body = args.get("body")
-            if to is None or body is None:
-                return
-            result = self.send_email_fn(to, subject, body)
-            self.message_log.append({
-                "role": "function",
-                "name": "send_email",
-                "content": json.dumps(result),
-            })
-            
-        elif name == "sign_message":
-            message = args.get("message")
-            for_agent = args.get("for_agent")
-            if message is None or for_agent is None:
-                return
-            if self.sign_message_fn is None:
-                return
-            result = self.sign_message_fn(message, for_agent)
-            self.message_log.append({
-                "role": "function",
-                "name": "sign_message",
-                "content": json.dumps(result),
-            })
-            
-        elif name == "sign_and_respond":
-            to_agent = args.get("to_agent")
-            message_to_sign = args.get("message_to_sign")
-            response_body = args.get("response_body")
-            subject = "Signed Message"  # Fixed subject since it's not in the schema
-            if to_agent is None or message_to_sign is None or response_body is None:
-                return
-            if self.sign_and_respond_fn is None:
-                return
-            result = self.sign_and_respond_fn(to_agent, message_to_sign, response_body, subject)
-            self.message_log.append({
-                "role": "function",
-                "name": "sign_and_respond",
-                "content": json.dumps(result),
-            })
-            
-        elif name == "submit_signature":
-            signed_message = args.get("signed_message")
-            if signed_message is None:
-                return
-            if self.submit_signature_fn is None:
-                return
-            result = self.submit_signature_fn(signed_message)
-            self.message_log.append({
-                "role": "function",
-                "name": "submit_signature",
-                "content": json.dumps(result),
-            })
-            
-        else:
-            pass
+        required, fn_attr, arg_keys, extra_args = self._TOOL_DISPATCH[name]
+        if any(args.get(k) is None for k in required):
+            return None
+        fn = getattr(self, fn_attr)
+        if fn is None:
+            return None
+        result = await asyncio.to_thread(fn, *[args.get(k, "") for k in arg_keys], *extra_args)
+        content = _dumps(result)
+        if len(content) > _MAX_TOOL_RESULT_CHARS and name not in _UNTRUNCATED_TOOLS:
+            # Large results are re-sent on every later completion – log a
+            # truncated copy
+            content = f"{content[:_MAX_TOOL_RESULT_CHARS]}…(truncated)"
+        return {
+            "role": "function",
+            "name": name,
+            "content": content,
+        }
  
\ No newline at end of file
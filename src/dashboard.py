@@ -3,15 +3,123 @@ Basic Visualization Dashboard - Phase 1
 Web interface showing all messages and agent status with auto-refresh.
 """
 
-import requests
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import threading
+import time
+import httpx
+import orjson
+from collections import OrderedDict
 from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
+from markupsafe import escape
 import uvicorn
 
 
+def _timestamp_key(msg: dict) -> str:
+    """Sort key for messages (ISO timestamps sort chronologically)."""
+    return msg.get('timestamp', '')
+
+
+# Template/static directories, independent of the working directory
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_TEMPLATES_DIR = _PROJECT_ROOT / "templates"
+_STATIC_DIR = _PROJECT_ROOT / "static"
+
+# Raw ISO timestamp -> 'HH:MM:SS'.  Every refresh re-renders the same
+# messages, so parse each timestamp only once.
+_time_fmt_cache: Dict[str, str] = {}
+_TIME_FMT_CACHE_MAX = 10000
+
+# Parsed session-result files kept by Dashboard.get_recent_games
+_GAME_CACHE_MAX = 100
+
+# Upstream (connect, read) timeouts, and the circuit breaker: after
+# _BREAKER_FAILURES consecutive failures a URL is skipped for _BREAKER_COOLDOWN s
+_CONNECT_TIMEOUT = 1.0
+_READ_TIMEOUT = 3.0
+_BREAKER_FAILURES = 3
+_BREAKER_COOLDOWN = 10.0
+
+
+def _format_time(raw: str) -> str:
+    """Format an ISO timestamp as HH:MM:SS; unparseable values pass through."""
+    formatted = _time_fmt_cache.get(raw)
+    if formatted is None:
+        try:
+            formatted = datetime.fromisoformat(raw).strftime('%H:%M:%S')
+        except (TypeError, ValueError):
+            formatted = raw
+        if len(_time_fmt_cache) >= _TIME_FMT_CACHE_MAX:
+            _time_fmt_cache.clear()
+        _time_fmt_cache[raw] = formatted
+    return formatted
+
+
+# Status badges for the render_* helpers; the set of statuses is tiny, so
+# build the markup once instead of formatting it for every row
+_STATUS_SPAN = {
+    status: f"<span class='status-{status}'>{status}</span>"
+    for status in ("sent", "delivered", "read", "active", "unknown")
+}
+
+
+def _status_span(status) -> str:
+    """Status badge HTML, escaping statuses outside the precomputed set."""
+    span = _STATUS_SPAN.get(status)
+    if span is None:
+        status = escape(status)
+        span = f"<span class='status-{status}'>{status}</span>"
+    return span
+
+
+def _ttl_cached(key: str, ttl: float):
+    """Memoise a Dashboard getter for *ttl* seconds.
+
+    Sync and async variants of the same getter share *key*, so either one
+    refreshes the value the other serves.  Concurrent async callers wait for
+    a single upstream fetch.
+    """
+    def decorator(fn):
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(self):
+                hit = self._ttl_cache.get(key)
+                if hit is not None and time.monotonic() - hit[1] < ttl:
+                    return hit[0]
+                lock = self._ttl_async_locks.get(key)
+                if lock is None:
+                    lock = self._ttl_async_locks[key] = asyncio.Lock()
+                async with lock:
+                    # Another request may have refreshed it while we waited
+                    hit = self._ttl_cache.get(key)
+                    if hit is not None and time.monotonic() - hit[1] < ttl:
+                        return hit[0]
+                    value = await fn(self)
+                    self._ttl_cache[key] = (value, time.monotonic())
+                    return value
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self):
+            with self._ttl_lock:
+                hit = self._ttl_cache.get(key)
+                if hit is not None and time.monotonic() - hit[1] < ttl:
+                    return hit[0]
+            value = fn(self)
+            with self._ttl_lock:
+                self._ttl_cache[key] = (value, time.monotonic())
+            return value
+        return wrapper
+    return decorator
+
+
 class Dashboard:
     """Dashboard for visualizing The Email Game"""
     
@@ -22,13 +130,73 @@ class Dashboard:
         self.email_server_url = email_server_url
         self.moderator_url = moderator_url
         self.dev_mode = dev_mode
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._session = None
+        # (filename, modified) -> game entry, LRU-bounded by _GAME_CACHE_MAX
+        self._game_cache: "OrderedDict[Tuple[str, float], dict]" = OrderedDict()
+        # url -> {"fails": consecutive failures, "open_until": monotonic time}
+        self._breaker: Dict[str, dict] = {}
+        
+        # Short-lived upstream response cache (see _ttl_cached) – absorbs the
+        # page auto-refresh from many open tabs
+        self._ttl_cache = {}
+        self._ttl_lock = threading.Lock()
+        self._ttl_async_locks = {}
+        
+        # /events subscribers, fed by a single shared upstream poller
+        self._subscribers = set()
+        self._poll_task: Optional[asyncio.Task] = None
+    
+    @property
+    def session(self):
+        """Pooled keep-alive requests session for the sync helpers.
+
+        requests is imported on first use; the API endpoints only need httpx.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=0)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            self._session.headers.update({"Connection": "keep-alive"})
+        return self._session
     
+    def _circuit_open(self, url: str) -> bool:
+        state = self._breaker.get(url)
+        return state is not None and time.monotonic() < state["open_until"]
+    
+    def _record_result(self, url: str, ok: bool):
+        """Reset the breaker for *url* on success; trip it after repeated failures."""
+        if ok:
+            self._breaker.pop(url, None)
+            return
+        state = self._breaker.setdefault(url, {"fails": 0, "open_until": 0.0})
+        state["fails"] += 1
+        if state["fails"] >= _BREAKER_FAILURES:
+            state["fails"] = 0
+            state["open_until"] = time.monotonic() + _BREAKER_COOLDOWN
+    
+    def _get(self, url: str):
+        """GET via the sync session; None while the circuit for *url* is open."""
+        if self._circuit_open(url):
+            return None
+        try:
+            response = self.session.get(url, timeout=(_CONNECT_TIMEOUT, _READ_TIMEOUT))
+        except Exception:
+            self._record_result(url, False)
+            raise
+        self._record_result(url, response.status_code == 200)
+        return response
+    
+    @_ttl_cached("messages", ttl=1.0)
     def get_all_messages(self):
         """Get all messages from the email server"""
         try:
-            response = requests.get(f"{self.email_server_url}/get_all_messages")
-            if response.status_code == 200:
-                data = response.json()
+            response = self._get(f"{self.email_server_url}/get_all_messages")
+            if response is not None and response.status_code == 200:
+                data = orjson.loads(response.content)
                 if data["success"]:
                     return data["messages"]
             return []
@@ -36,14 +204,15 @@ class Dashboard:
             print(f"Error getting messages: {e}")
             return []
     
+    @_ttl_cached("agents", ttl=2.0)
     def get_agents_status(self):
         """Get all agents and their status from the moderator"""
         if self.moderator_url is None:
             return []  # Return empty list if moderator is disabled
         try:
-            response = requests.get(f"{self.moderator_url}/agents")
-            if response.status_code == 200:
-                data = response.json()
+            response = self._get(f"{self.moderator_url}/agents")
+            if response is not None and response.status_code == 200:
+                data = orjson.loads(response.content)
                 if data["success"]:
                     return data["agents"]
             return []
@@ -51,25 +220,27 @@ class Dashboard:
             print(f"Error getting agents: {e}")
             return []
     
+    @_ttl_cached("game_status", ttl=2.0)
     def get_game_status(self):
         """Get current game status from the moderator"""
         if self.moderator_url is None:
             return {"current_round": 0, "round_active": False, "pending_instructions": 0}  # Return default status
         try:
-            response = requests.get(f"{self.moderator_url}/game_status")
-            if response.status_code == 200:
-                return response.json()
+            response = self._get(f"{self.moderator_url}/game_status")
+            if response is not None and response.status_code == 200:
+                return orjson.loads(response.content)
             return {}
         except Exception as e:
             print(f"Error getting game status: {e}")
             return {}
     
+    @_ttl_cached("queue", ttl=1.0)
     def get_enhanced_queue_status(self):
         """Get queue status with connection information."""
         try:
-            response = requests.get(f"{self.email_server_url}/queue_status", timeout=5)
-            if response.status_code == 200:
-                return response.json()
+            response = self._get(f"{self.email_server_url}/queue_status")
+            if response is not None and response.status_code == 200:
+                return orjson.loads(response.content)
         except Exception as e:
             print(f"Error getting queue status: {e}")
         
@@ -80,95 +251,241 @@ class Dashboard:
             "game_in_progress": False
         }
     
-    def get_recent_games(self):
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """Return the shared async client for email-server calls (created lazily)."""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.email_server_url,
+                timeout=httpx.Timeout(_READ_TIMEOUT, connect=_CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._aclient
+    
+    async def aclose(self):
+        """Close the shared async client (app shutdown)."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+    
+    async def _aget(self, url: str, **kwargs) -> Optional[httpx.Response]:
+        """Async _get: None while the circuit for *url* is open."""
+        if self._circuit_open(url):
+            return None
+        try:
+            response = await self._get_aclient().get(url, **kwargs)
+        except Exception:
+            self._record_result(url, False)
+            raise
+        self._record_result(url, response.status_code == 200)
+        return response
+    
+    @_ttl_cached("messages", ttl=1.0)
+    async def aget_all_messages(self):
+        """Async variant of get_all_messages"""
+        try:
+            response = await self._aget(f"{self.email_server_url}/get_all_messages")
+            if response is not None and response.status_code == 200:
+                data = orjson.loads(response.content)
+                if data["success"]:
+                    return data["messages"]
+            return []
+        except Exception as e:
+            print(f"Error getting messages: {e}")
+            return []
+    
+    @_ttl_cached("agents", ttl=2.0)
+    async def aget_agents_status(self):
+        """Async variant of get_agents_status"""
+        if self.moderator_url is None:
+            return []  # Return empty list if moderator is disabled
+        try:
+            response = await self._aget(f"{self.moderator_url}/agents")
+            if response is not None and response.status_code == 200:
+                data = orjson.loads(response.content)
+                if data["success"]:
+                    return data["agents"]
+            return []
+        except Exception as e:
+            print(f"Error getting agents: {e}")
+            return []
+    
+    @_ttl_cached("game_status", ttl=2.0)
+    async def aget_game_status(self):
+        """Async variant of get_game_status"""
+        if self.moderator_url is None:
+            return {"current_round": 0, "round_active": False, "pending_instructions": 0}  # Return default status
+        try:
+            response = await self._aget(f"{self.moderator_url}/game_status")
+            if response is not None and response.status_code == 200:
+                return orjson.loads(response.content)
+            return {}
+        except Exception as e:
+            print(f"Error getting game status: {e}")
+            return {}
+    
+    @_ttl_cached("queue", ttl=1.0)
+    async def aget_enhanced_queue_status(self):
+        """Async variant of get_enhanced_queue_status"""
+        try:
+            response = await self._aget(f"{self.email_server_url}/queue_status")
+            if response is not None and response.status_code == 200:
+                return orjson.loads(response.content)
+        except Exception as e:
+            print(f"Error getting queue status: {e}")
+        
+        return {
+            "queue_length": 0, 
+            "agents_waiting": [], 
+            "connected_agents": [],
+            "game_in_progress": False
+        }
+    
+    @_ttl_cached("recent_games", ttl=10.0)
+    async def get_recent_games(self):
         """Get recent game results for dashboard."""
         try:
-            response = requests.get(f"{self.email_server_url}/session_results", timeout=5)
-            if response.status_code == 200:
-                results = response.json()
+            response = await self._aget(f"{self.email_server_url}/session_results")
+            if response is not None and response.status_code == 200:
+                results = orjson.loads(response.content)
                 if results.get('success') and results.get('files'):
                     # Get latest 5 games
                     games = results['files'][:5]
-                    # Fetch actual game data for each
-                    game_data = []
-                    for game in games:
+                    # Result files never change once written, so only fetch
+                    # the games we haven't seen, in one round-trip
+                    missing = [
+                        game['filename'] for game in games
+                        if (game['filename'], game['modified']) not in self._game_cache
+                    ]
+                    if missing:
                         try:
-                            game_response = requests.get(f"{self.email_server_url}/session_results/{game['filename']}", timeout=5)
-                            if game_response.status_code == 200:
-                                game_result = game_response.json()
-                                if game_result.get('success') and game_result.get('data'):
-                                    game_info = {
-                                        'filename': game['filename'],
-                                        'modified': game['modified'],
-                                        'data': game_result['data']
-                                    }
-                                    game_data.append(game_info)
+                            batch_response = await self._aget(
+                                f"{self.email_server_url}/session_results/batch",
+                                params={"filenames": ",".join(missing)},
+                            )
+                            if batch_response is None:
+                                # Circuit open – fall back to just filenames
+                                return games
+                            batch_response.raise_for_status()
+                            payloads = orjson.loads(batch_response.content).get('data') or {}
                         except Exception as e:
-                            print(f"Error fetching game data for {game['filename']}: {e}")
-                            # Fall back to just filename
-                            game_data.append(game)
+                            print(f"Error fetching game data: {e}")
+                            # Fall back to just filenames
+                            return games
+                    else:
+                        payloads = {}
+                    game_data = []
+                    for game in games:
+                        key = (game['filename'], game['modified'])
+                        game_info = self._game_cache.get(key)
+                        if game_info is not None:
+                            self._game_cache.move_to_end(key)
+                        else:
+                            payload = payloads.get(game['filename'])
+                            if not payload:
+                                continue
+                            game_info = {
+                                'filename': game['filename'],
+                                'modified': game['modified'],
+                                'data': payload
+                            }
+                            self._game_cache[key] = game_info
+                            if len(self._game_cache) > _GAME_CACHE_MAX:
+                                self._game_cache.popitem(last=False)
+                        game_data.append(game_info)
                     return game_data
         except Exception as e:
             print(f"Error getting recent games: {e}")
         
         return []
     
+    def subscribe(self) -> asyncio.Queue:
+        """Register an /events client, starting the shared poller if needed."""
+        queue = asyncio.Queue(maxsize=1)
+        self._subscribers.add(queue)
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_changes())
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove an /events client; the poller stops with the last one."""
+        self._subscribers.discard(queue)
+    
+    async def _poll_changes(self, interval: float = 1.0):
+        """Poll the upstream once for all subscribers and fan out changes."""
+        last_state = None
+        while self._subscribers:
+            messages, agents, game_status = await asyncio.gather(
+                self.aget_all_messages(),
+                self.aget_agents_status(),
+                self.aget_game_status(),
+            )
+            state = {
+                "messages": len(messages),
+                "last_timestamp": max(map(_timestamp_key, messages), default=""),
+                "agents": len(agents),
+                "current_round": game_status.get("current_round", 0),
+            }
+            # Clients rendered the page just before subscribing, so only
+            # changes after the first poll are worth a refresh
+            if last_state is not None and state != last_state:
+                for queue in self._subscribers:
+                    # Keep only the newest state for slow clients
+                    if queue.full():
+                        queue.get_nowait()
+                    queue.put_nowait(state)
+            last_state = state
+            await asyncio.sleep(interval)
+    
     def render_messages(self):
         """Render messages as HTML (for testing)"""
         messages = self.get_all_messages()
-        html = "<h2>Message Log</h2>\n"
+        parts = ["<h2>Message Log</h2>\n"]
         
         if not messages:
-            html += "<p>No messages yet.</p>"
-            return html
+            parts.append("<p>No messages yet.</p>")
+            return "".join(parts)
         
-        html += f"<p>Total messages: {len(messages)}</p>\n"
-        html += "<div class='messages'>\n"
+        parts.append(f"<p>Total messages: {len(messages)}</p>\n")
+        parts.append("<div class='messages'>\n")
         
         # Sort messages by timestamp (newest first)
-        sorted_messages = sorted(messages, key=lambda x: x.get('timestamp', ''), reverse=True)
+        sorted_messages = sorted(messages, key=_timestamp_key, reverse=True)
         
         for msg in sorted_messages:
-            timestamp = msg.get('timestamp', 'Unknown')
-            if timestamp != 'Unknown':
-                try:
-                    # Format timestamp nicely
-                    dt = datetime.fromisoformat(timestamp)
-                    timestamp = dt.strftime('%H:%M:%S')
-                except:
-                    pass
+            timestamp = _format_time(msg.get('timestamp', 'Unknown'))
             
-            html += f"""
+            parts.append(f"""
             <div class='message'>
                 <strong>{timestamp}</strong> - 
-                From: <span class='from'>{msg.get('from', 'Unknown')}</span> → 
-                To: <span class='to'>{msg.get('to', 'Unknown')}</span><br>
-                <strong>Subject:</strong> {msg.get('subject', 'No subject')}<br>
-                <strong>Body:</strong> {msg.get('body', 'No body')}<br>
-                <strong>Status:</strong> <span class='status-{msg.get("status", "unknown")}'>{msg.get('status', 'Unknown')}</span>
+                From: <span class='from'>{escape(msg.get('from', 'Unknown'))}</span> → 
+                To: <span class='to'>{escape(msg.get('to', 'Unknown'))}</span><br>
+                <strong>Subject:</strong> {escape(msg.get('subject', 'No subject'))}<br>
+                <strong>Body:</strong> {escape(msg.get('body', 'No body'))}<br>
+                <strong>Status:</strong> {_status_span(msg.get('status', 'unknown'))}
             </div>
-            """
+            """)
         
-        html += "</div>\n"
-        return html
+        parts.append("</div>\n")
+        return "".join(parts)
     
     def render_agent_status(self):
         """Render agent status as HTML (for testing)"""
         agents = self.get_agents_status()
         game_status = self.get_game_status()
         
-        html = "<h2>Agent Status</h2>\n"
+        parts = ["<h2>Agent Status</h2>\n"]
         
         if not agents:
-            html += "<p>No agents registered.</p>"
-            return html
+            parts.append("<p>No agents registered.</p>")
+            return "".join(parts)
         
-        html += f"<p>Total agents: {len(agents)}</p>\n"
-        html += f"<p>Current round: {game_status.get('current_round', 0)}</p>\n"
-        html += f"<p>Round active: {game_status.get('round_active', False)}</p>\n"
-        html += f"<p>Pending instructions: {game_status.get('pending_instructions', 0)}</p>\n"
-        
-        html += "<div class='agents'>\n"
+        parts.append(
+            f"<p>Total agents: {len(agents)}</p>\n"
+            f"<p>Current round: {game_status.get('current_round', 0)}</p>\n"
+            f"<p>Round active: {game_status.get('round_active', False)}</p>\n"
+            f"<p>Pending instructions: {game_status.get('pending_instructions', 0)}</p>\n"
+            "<div class='agents'>\n"
+        )
         
         for agent in agents:
             agent_id = agent.get('agent_id', 'Unknown')
@@ -176,16 +493,16 @@ class Dashboard:
             score = agent.get('score', 0)
             status = agent.get('status', 'unknown')
             
-            html += f"""
+            parts.append(f"""
             <div class='agent'>
-                <strong>{agent_id}</strong> ({username})<br>
-                Status: <span class='status-{status}'>{status}</span><br>
-                Score: <span class='score'>{score}</span>
+                <strong>{escape(agent_id)}</strong> ({escape(username)})<br>
+                Status: {_status_span(status)}<br>
+                Score: <span class='score'>{escape(score)}</span>
             </div>
-            """
+            """)
         
-        html += "</div>\n"
-        return html
+        parts.append("</div>\n")
+        return "".join(parts)
     
     def get_displayed_messages(self):
         """Get messages for testing (returns list length)"""
@@ -195,18 +512,51 @@ class Dashboard:
 # Global dashboard instance - disable moderator URL since we use unified architecture
 dashboard = Dashboard(moderator_url=None)
 
+
+class _GZipExceptEvents(GZipMiddleware):
+    """GZip everything but the /events stream, which must flush per event."""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/events":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 # FastAPI app
-app = FastAPI(title="Inbox Arena Dashboard", version="1.0.0")
+# JSON endpoints serialise with orjson
+app = FastAPI(title="Inbox Arena Dashboard", version="1.0.0", default_response_class=ORJSONResponse)
+# Message JSON and HTML are highly repetitive – compress anything non-trivial
+app.add_middleware(_GZipExceptEvents, minimum_size=500, compresslevel=5)
+
+
+@functools.lru_cache(maxsize=1)
+def _templates():
+    """Jinja2 environment, built on the first HTML render."""
+    from fastapi.templating import Jinja2Templates
+    return Jinja2Templates(directory=str(_TEMPLATES_DIR))
+
+
+@app.on_event("startup")
+async def _open_upstream_client():
+    """Create the shared httpx client on the server's event loop."""
+    dashboard._get_aclient()
+
+
+@app.on_event("startup")
+async def _mount_static():
+    """Serve /static if the directory exists."""
+    from fastapi.staticfiles import StaticFiles
+    try:
+        app.mount("/static", StaticFiles(directory=str(_STATIC_DIR)), name="static")
+    except:
+        # Directory doesn't exist yet, that's fine
+        pass
 
-# Templates
-templates = Jinja2Templates(directory="templates")
 
-# Create static files directory (if needed)
-try:
-    app.mount("/static", StaticFiles(directory="static"), name="static")
-except:
-    # Directory doesn't exist yet, that's fine
-    pass
+@app.on_event("shutdown")
+async def _close_upstream_client():
+    await dashboard.aclose()
 
 
 @app.get("/health")
@@ -215,70 +565,91 @@ async def health_check():
     return {"status": "healthy", "service": "dashboard"}
 
 
-@app.get("/api/queue")
+@app.get("/api/queue", response_class=ORJSONResponse, response_model=None)
 async def queue_status():
     """API endpoint for current queue status."""
-    return dashboard.get_enhanced_queue_status()
+    # Upstream JSON needs no re-validation; hand it straight to orjson
+    return ORJSONResponse(await dashboard.aget_enhanced_queue_status())
 
 
-@app.get("/api/recent_games")
+@app.get("/api/recent_games", response_class=ORJSONResponse, response_model=None)
 async def recent_games():
     """API endpoint for recent game results."""
-    return {"games": dashboard.get_recent_games()}
+    return ORJSONResponse({"games": await dashboard.get_recent_games()})
 
 
-@app.post("/api/dev/clear_server")
+@app.post("/api/dev/clear_server", response_class=ORJSONResponse, response_model=None)
 async def dev_clear_server():
     """Development helper to clear server state."""
     if not dashboard.dev_mode:
         return {"error": "Development mode not enabled"}
     
     try:
-        import requests
-        response = requests.post(f"{dashboard.email_server_url}/clear_state", timeout=5)
+        response = await dashboard._get_aclient().post("/clear_state")
         return {"success": response.status_code == 200, "status_code": response.status_code}
     except Exception as e:
         return {"error": str(e)}
 
 
+@app.get("/events")
+async def events(request: Request):
+    """Server-Sent Events stream announcing message/agent/round changes."""
+    queue = dashboard.subscribe()
+    
+    async def event_stream():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    state = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: update\ndata: {orjson.dumps(state).decode()}\n\n"
+        finally:
+            dashboard.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _format_messages(messages):
+    """Format raw messages for the templates, newest first"""
+    return [
+        {
+            'timestamp': _format_time(msg.get('timestamp', 'Unknown')),
+            'from': msg.get('from', 'Unknown'),
+            'to': msg.get('to', 'Unknown'),
+            'subject': msg.get('subject', 'No subject'),
+            'body': msg.get('body', 'No body'),
+            'status': msg.get('status', 'unknown')
+        }
+        for msg in sorted(messages, key=_timestamp_key, reverse=True)
+    ]
+
+
 @app.get("/", response_class=HTMLResponse)
 async def dashboard_home(request: Request, agent: str = None, agent1: str = None, agent2: str = None):
     """Main dashboard page with optional agent filtering or dual-agent comparison"""
     try:
-        messages = dashboard.get_all_messages()
-        agents = dashboard.get_agents_status()
-        game_status = dashboard.get_game_status()
-        
-        # Format messages for display
-        formatted_messages = []
-        for msg in sorted(messages, key=lambda x: x.get('timestamp', ''), reverse=True):
-            timestamp = msg.get('timestamp', 'Unknown')
-            if timestamp != 'Unknown':
-                try:
-                    dt = datetime.fromisoformat(timestamp)
-                    timestamp = dt.strftime('%H:%M:%S')
-                except:
-                    pass
-            
-            formatted_messages.append({
-                'timestamp': timestamp,
-                'from': msg.get('from', 'Unknown'),
-                'to': msg.get('to', 'Unknown'),
-                'subject': msg.get('subject', 'No subject'),
-                'body': msg.get('body', 'No body'),
-                'status': msg.get('status', 'unknown')
-            })
+        # Independent upstream calls – pay for the slowest, not the sum
+        messages, agents, game_status = await asyncio.gather(
+            dashboard.aget_all_messages(),
+            dashboard.aget_agents_status(),
+            dashboard.aget_game_status(),
+        )
         
-        # Detect all available agents from messages
-        available_agents = set()
-        for msg in formatted_messages:
-            if msg['from'] != 'Unknown':
-                available_agents.add(msg['from'])
-            if msg['to'] != 'Unknown':
-                available_agents.add(msg['to'])
+        # Format messages for display (newest first) in a single pass
+        formatted_messages = _format_messages(messages)
         
-        # Sort agents alphabetically 
-        available_agents = sorted(available_agents)
+        # Detect all available agents from messages, sorted alphabetically
+        available_agents = sorted(
+            ({msg['from'] for msg in formatted_messages} | {msg['to'] for msg in formatted_messages})
+            - {'Unknown'}
+        )
         
         # Handle different filtering modes
         filtered_messages = formatted_messages
@@ -289,14 +660,13 @@ async def dashboard_home(request: Request, agent: str = None, agent1: str = None
         if agent1 and agent2:
             # Dual-agent comparison mode
             is_dual_mode = True
-            agent1_messages = [
-                msg for msg in formatted_messages 
-                if msg['from'] == agent1 or msg['to'] == agent1
-            ]
-            agent2_messages = [
-                msg for msg in formatted_messages 
-                if msg['from'] == agent2 or msg['to'] == agent2
-            ]
+            # One pass routes each message to either (or both) agents' lists
+            for msg in formatted_messages:
+                sender, recipient = msg['from'], msg['to']
+                if sender == agent1 or recipient == agent1:
+                    agent1_messages.append(msg)
+                if sender == agent2 or recipient == agent2:
+                    agent2_messages.append(msg)
             # Don't filter the main message list in dual mode
             filtered_messages = formatted_messages
         elif agent:
@@ -320,71 +690,140 @@ async def dashboard_home(request: Request, agent: str = None, agent1: str = None
             'agent1': agent1,
             'agent2': agent2,
             'agent1_messages': agent1_messages,
-            'agent2_messages': agent2_messages
+            'agent2_messages': agent2_messages,
+            'events_url': '/events'
         }
         
-        return templates.TemplateResponse("dashboard.html", context)
+        return _templates().TemplateResponse("dashboard.html", context)
     
     except Exception as e:
-        # Fallback to simple HTML if template fails
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Inbox Arena Dashboard</title>
-            <meta http-equiv="refresh" content="5">
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .message {{ border: 1px solid #ccc; margin: 10px 0; padding: 10px; background: #f9f9f9; }}
-                .agent {{ border: 1px solid #ddd; margin: 5px 0; padding: 8px; background: #f5f5f5; }}
-                .status-sent {{ color: blue; }}
-                .status-delivered {{ color: green; }}
-                .status-read {{ color: purple; }}
-                .status-active {{ color: green; font-weight: bold; }}
-                .from {{ color: #d00; font-weight: bold; }}
-                .to {{ color: #00d; font-weight: bold; }}
-                .score {{ font-weight: bold; color: #060; }}
-                h1 {{ color: #333; }}
-                h2 {{ color: #666; border-bottom: 2px solid #ddd; }}
-                .error {{ color: red; font-style: italic; }}
-            </style>
-        </head>
-        <body>
-            <h1>Inbox Arena Dashboard</h1>
-            <p class="error">Template error: {str(e)}</p>
-            <p>Updated: {datetime.now().strftime('%H:%M:%S')}</p>
-            {dashboard.render_agent_status()}
-            {dashboard.render_messages()}
-        </body>
-        </html>
-        """
+        # Fallback to a simple autoescaped page if the main template fails
+        messages, agents, game_status = await asyncio.gather(
+            dashboard.aget_all_messages(),
+            dashboard.aget_agents_status(),
+            dashboard.aget_game_status(),
+        )
+        formatted_messages = _format_messages(messages)
+        try:
+            html = _templates().get_template("messages.html").render(
+                error=str(e),
+                current_time=datetime.now().strftime('%H:%M:%S'),
+                agents=agents,
+                game_status=game_status,
+                messages=formatted_messages,
+            )
+        except Exception as render_error:
+            # Last resort: no template needed
+            html = _plain_page(f"{e}; {render_error}", formatted_messages)
         return HTMLResponse(content=html)
 
 
-@app.get("/api/messages")
-async def get_messages_api():
+def _plain_page(error: str, messages: List[dict]) -> str:
+    """Minimal escaped message page for when no template can be rendered."""
+    parts = [
+        "<!DOCTYPE html>\n<html>\n<head><title>Inbox Arena Dashboard</title>"
+        "<meta http-equiv=\"refresh\" content=\"5\"></head>\n<body>\n"
+        "<h1>Inbox Arena Dashboard</h1>\n",
+        f"<p class=\"error\">Template error: {escape(error)}</p>\n",
+        f"<p>Updated: {datetime.now().strftime('%H:%M:%S')}</p>\n",
+        f"<h2>Messages ({len(messages)})</h2>\n",
+    ]
+    for msg in messages:
+        parts.append(
+            f"<div class='message'><strong>{escape(msg['timestamp'])}</strong> - "
+            f"From: {escape(msg['from'])} → To: {escape(msg['to'])}<br>"
+            f"<strong>Subject:</strong> {escape(msg['subject'])}<br>"
+            f"<strong>Body:</strong> {escape(msg['body'])}<br>"
+            f"<strong>Status:</strong> {_status_span(msg['status'])}</div>\n"
+        )
+    parts.append("</body>\n</html>\n")
+    return "".join(parts)
+
+
+def _etag(*parts) -> str:
+    """Short quoted entity tag over *parts*."""
+    digest = hashlib.blake2s(":".join(map(str, parts)).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+# Messages serialised per chunk when streaming /api/messages
+_STREAM_BATCH = 100
+
+
+def _conditional_json(request: Request, etag: str, build_content):
+    """304 if the client already has *etag*, else the JSON from build_content()."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(build_content(), headers={"ETag": etag, "Cache-Control": "max-age=1"})
+
+
+@app.get("/api/messages", response_class=ORJSONResponse, response_model=None)
+async def get_messages_api(request: Request):
     """API endpoint to get messages as JSON"""
-    messages = dashboard.get_all_messages()
-    return {"success": True, "messages": messages, "count": len(messages)}
+    messages = await dashboard.aget_all_messages()
+    # New messages change the count + newest timestamp; statuses change in
+    # place (sent -> delivered -> read), so they are part of the tag too
+    etag = _etag(
+        len(messages),
+        max(map(_timestamp_key, messages), default=""),
+        ",".join([msg.get('status', '') for msg in messages]),
+    )
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    async def stream():
+        # Serialise incrementally so the first bytes go out before the whole
+        # list is encoded; batching keeps the number of ASGI sends small
+        yield b'{"success":true,"messages":['
+        for start in range(0, len(messages), _STREAM_BATCH):
+            chunk = b",".join(map(orjson.dumps, messages[start:start + _STREAM_BATCH]))
+            yield chunk if start == 0 else b"," + chunk
+        yield b'],"count":%d}' % len(messages)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "max-age=1"},
+    )
 
 
-@app.get("/api/agents")
-async def get_agents_api():
+@app.get("/api/agents", response_class=ORJSONResponse, response_model=None)
+async def get_agents_api(request: Request):
     """API endpoint to get agents as JSON"""
-    agents = dashboard.get_agents_status()
-    return {"success": True, "agents": agents, "count": len(agents)}
+    agents = await dashboard.aget_agents_status()
+    # Agents carry no timestamps; the list is small enough to hash outright
+    etag = _etag(orjson.dumps(agents).decode())
+    return _conditional_json(
+        request, etag,
+        lambda: {"success": True, "agents": agents, "count": len(agents)},
+    )
 
 
-@app.get("/api/status")
+@app.get("/api/status", response_class=ORJSONResponse, response_model=None)
 async def get_status_api():
     """API endpoint to get game status as JSON"""
-    game_status = dashboard.get_game_status()
-    return game_status
+    game_status = await dashboard.aget_game_status()
+    return ORJSONResponse(game_status)
 
 
 if __name__ == "__main__":
     import sys
     
+    # Production: one uvicorn worker per core under gunicorn (run from the
+    # repo root).  Each worker keeps its own TTL cache and /events poller,
+    # which is fine for a read-only view.
+    if "--prod" in sys.argv:
+        import os
+        workers = str(os.cpu_count() or 1)
+        print(f"Starting Inbox Arena Dashboard (Production, {workers} workers)...")
+        os.execvp("gunicorn", [
+            "gunicorn", "src.dashboard:app",
+            "-k", "uvicorn.workers.UvicornWorker",
+            "-w", workers,
+            "--worker-connections", "1000",
+            "-b", "0.0.0.0:8002",
+        ])
+    
     # Check for dev mode flag
     dev_mode = "--dev" in sys.argv
     
@@ -404,4 +843,14 @@ if __name__ == "__main__":
     if dev_mode:
         print("   • /api/dev/clear_server - Clear server state (dev only)")
     
-    uvicorn.run(app, host="0.0.0.0", port=8002) 
\ No newline at end of file
+    # uvloop/httptools are C-accelerated; fall back to the pure-Python
+    # defaults where they aren't installed (e.g. uvloop on Windows)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8002,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        log_level="warning",
+        access_log=False,
+    )
@@ -4,12 +4,22 @@ Provides REST API for agent communication with message storage and delivery trac
 Enhanced with request queuing for handling concurrent moderator messages.
 """
 
-import uuid
+import base64
+import functools
+import hashlib
+import heapq
+import hmac
+import importlib.util
+import itertools
+import secrets
+import threading
+import time
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depends, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
@@ -17,7 +27,7 @@ import uvicorn
 import asyncio
 import os
 import jwt  # PyJWT – added in requirements.txt
-import json
+import orjson
 from concurrent.futures import ThreadPoolExecutor
 from src.game.config import NUM_AGENTS
 from src.game.service import start_session
@@ -29,19 +39,28 @@ from src.game.service import start_session
 # Redis dependency removed - using in-memory storage instead
 
 JWT_SECRET = os.getenv("JWT_SECRET", "inbox-arena-secret")
+JWT_SECRET_BYTES = JWT_SECRET.encode()
 
 # Security validation helpers
 def _validate_recipient(to_agent: str) -> bool:
     """Validate that the recipient agent exists and is valid."""
     if not to_agent or not isinstance(to_agent, str):
         return False
-    
+    # Reasonable length – checked first so oversized names never enter the cache
+    if len(to_agent) > 50:
+        return False
+    return _valid_agent_id(to_agent)
+
+
+# Recipients come from a tiny set of agent ids, so memoise the format check
+@functools.lru_cache(maxsize=256)
+def _valid_agent_id(to_agent: str) -> bool:
     # Allow moderator as a special recipient
     if to_agent == "moderator":
         return True
     
-    # Basic validation: alphanumeric and underscore only, reasonable length
-    if not to_agent.replace("_", "").isalnum() or len(to_agent) > 50:
+    # Basic validation: alphanumeric and underscore only
+    if not to_agent.replace("_", "").isalnum():
         return False
     
     # TODO: Could add Redis lookup to verify agent is registered
@@ -52,7 +71,98 @@ def _validate_recipient(to_agent: str) -> bool:
 # Auth helpers
 # ---------------------------------------------------------------------------
 
-def _require_token(request: Request, *, allow_header: bool = True) -> str:
+# Successful decodes, keyed by a hash of the token: key -> (sub, exp, cached_until).
+# Agents present the same token on every call, so most requests skip jwt.decode.
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: Dict[bytes, tuple] = {}
+# Our tokens are ~150 bytes; anything this long is not one of them
+_MAX_TOKEN_LENGTH = 4096
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _check_header(header_b64: str) -> None:
+    """Reject tokens whose header is not valid JSON declaring alg HS256."""
+    try:
+        header = orjson.loads(_b64url_decode(header_b64))
+    except ValueError:
+        raise jwt.DecodeError("Malformed token")
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+
+def _verify_hs256(token: str, header_checked: bool = False) -> dict:
+    """Verify an HS256 JWT and return its claims.
+
+    Tokens are only ever minted by ``register_agent`` with HS256, so this skips
+    PyJWT's generic algorithm dispatch; the HMAC itself runs in OpenSSL.  Raises
+    the same ``jwt`` exceptions as ``jwt.decode``.  Pass *header_checked* when
+    the caller already ran ``_check_header`` on this token.
+    """
+    try:
+        header_b64, payload_b64, sig_b64 = token.split(".")
+        signature = _b64url_decode(sig_b64)
+        signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
+    except ValueError:
+        raise jwt.DecodeError("Malformed token")
+    if not header_checked:
+        _check_header(header_b64)
+
+    expected = hmac.new(JWT_SECRET_BYTES, signing_input, hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except ValueError:
+        raise jwt.DecodeError("Invalid payload")
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload")
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)):
+            raise jwt.DecodeError("Expiration Time claim (exp) must be a number")
+        if exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
+
+async def _token_subject(token: str) -> Optional[str]:
+    """Return the ``sub`` claim of a valid HS256 token.
+
+    Raises ``jwt.ExpiredSignatureError`` / ``jwt.InvalidTokenError``; only
+    successful decodes are cached.
+    """
+    # Cheap shape checks first so garbage never reaches the hash
+    if len(token) > _MAX_TOKEN_LENGTH or token.count(".") != 2:
+        raise jwt.DecodeError("Malformed token")
+
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    now = time.time()
+    hit = _token_cache.get(key)
+    if hit is not None:
+        sub, exp, cached_until = hit
+        if now < exp and now < cached_until:
+            return sub
+        _token_cache.pop(key, None)
+
+    # Cache miss: verification is one short HMAC-SHA256 (microseconds), cheaper
+    # than a threadpool hop, so it runs inline on the event loop
+    _check_header(token.partition(".")[0])
+    payload = _verify_hs256(token, header_checked=True)
+    sub = payload.get("sub")
+    if sub:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            _token_cache.pop(next(iter(_token_cache)), None)
+        _token_cache[key] = (sub, payload.get("exp", float("inf")), now + _TOKEN_CACHE_TTL)
+    return sub
+
+
+async def _require_token(request: Request, *, allow_header: bool = True) -> str:
     """FastAPI dependency that returns the *agent_id* from a valid Bearer JWT.
 
     Raises 401 if no token supplied or invalid, 403 if expired.
@@ -73,8 +183,7 @@ def _require_token(request: Request, *, allow_header: bool = True) -> str:
         raise HTTPException(status_code=401, detail="Missing token")
 
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
-        agent_id = payload.get("sub")
+        agent_id = await _token_subject(token)
         if not agent_id:
             raise HTTPException(status_code=401, detail="Invalid token payload")
     except jwt.ExpiredSignatureError:
@@ -86,6 +195,28 @@ def _require_token(request: Request, *, allow_header: bool = True) -> str:
     request.state.agent_id = agent_id
     return agent_id
 
+def _timestamp_key(msg: "StoredMsg") -> str:
+    """Sort key for messages (ISO timestamps sort chronologically)."""
+    return msg.timestamp
+
+
+# Local-time ISO timestamps; the date/time part only changes once a second.
+# (second, prefix) is swapped as one tuple so concurrent writers never pair
+# one second's prefix with another's fraction.
+_iso_cache = (-1, "")
+
+
+def _iso_now() -> str:
+    """Current local time as an ISO-8601 string with microseconds."""
+    global _iso_cache
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_cache = (second, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+
 class Message(BaseModel):
     """Message model for email simulation"""
     from_agent: str
@@ -97,6 +228,37 @@ class Message(BaseModel):
     status: str = "sent"  # sent, delivered, read
 
 
+class StoredMsg:
+    """A stored message.  Slotted to keep per-message memory small."""
+    __slots__ = ("message_id", "frm", "to", "subject", "body", "timestamp", "status")
+
+    def __init__(self, message_id: str, frm: str, to: str, subject: str, body: str,
+                 timestamp: str, status: str = "sent"):
+        self.message_id = message_id
+        self.frm = frm
+        self.to = to
+        self.subject = subject
+        self.body = body
+        self.timestamp = timestamp
+        self.status = status
+
+    def to_dict(self) -> Dict[str, str]:
+        """Wire format of the message (sender under "from")"""
+        return {
+            "message_id": self.message_id,
+            "from": self.frm,
+            "to": self.to,
+            "subject": self.subject,
+            "body": self.body,
+            "timestamp": self.timestamp,
+            "status": self.status
+        }
+
+
+def _asdict(messages: List[StoredMsg]) -> List[Dict]:
+    return [msg.to_dict() for msg in messages]
+
+
 class SendMessageRequest(BaseModel):
     """Request model for sending messages - sender derived from JWT token"""
     to: str
@@ -109,16 +271,44 @@ class BatchSendRequest(BaseModel):
     messages: List[SendMessageRequest]
 
 
+# How long the delivery task waits to coalesce a burst of stored messages
+_COALESCE_WINDOW = 0.005
+
+
 class EmailServer:
     """Core email server for message storage and routing with request queuing"""
     
     def __init__(self):
-        self.messages: List[Dict] = []
+        self.messages: List[StoredMsg] = []
         self.message_status: Dict[str, str] = {}
-        # Request queue for handling bursts
-        self.message_queue: asyncio.Queue = None  # Will be created when needed
-        self.queue_processor_task: Optional[asyncio.Task] = None
-        self._queue_started = False
+        # Indexes over self.messages (same objects, insertion order)
+        self.by_recipient: Dict[str, List[StoredMsg]] = defaultdict(list)
+        self.by_sender: Dict[str, List[StoredMsg]] = defaultdict(list)
+        self.by_id: Dict[str, StoredMsg] = {}
+        # Guards the store and its indexes: the writer thread appends while
+        # the event loop reads, appends (/send_message) and updates statuses.
+        # Timestamps are taken under it so append order is timestamp order.
+        self._store_lock = threading.Lock()
+        # Message ids: a random per-process prefix plus a counter – unique
+        # across restarts without a urandom read per message
+        self._id_prefix = secrets.token_hex(4)
+        self._id_counter = itertools.count(1)
+        # Queued stores are handed to a dedicated writer thread that builds
+        # and appends them, keeping that Python work off the event loop.  Items
+        # are (message_ids, batch, loop) and are stored in FIFO order; ids are
+        # assigned at submit time so callers never wait on the thread.
+        self._store_queue: deque = deque()
+        self._store_cond = threading.Condition()
+        self._store_thread: Optional[threading.Thread] = None
+        # WebSocket delivery: stored messages are pushed onto one outbox that
+        # a long-lived task on the server loop drains into per-recipient
+        # backlogs, each sent by its own task so a slow client only delays
+        # its own messages
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._outbox: Optional[asyncio.Queue] = None
+        self._delivery_task: Optional[asyncio.Task] = None
+        self._backlog: Dict[str, List[Dict]] = {}
+        self._senders: Dict[str, asyncio.Task] = {}
 
         # In-memory storage (replaces Redis)
         self.registered_agents: Dict[str, Dict[str, str]] = {}
@@ -126,81 +316,145 @@ class EmailServer:
         self.current_game_in_progress: bool = False
         self._queue_lock = asyncio.Lock()
     
-    def _ensure_queue_started(self):
-        """Ensure the queue processor is started (lazy initialization)"""
-        if not self._queue_started:
-            try:
-                if self.message_queue is None:
-                    self.message_queue = asyncio.Queue()
-                self.queue_processor_task = asyncio.create_task(self._process_message_queue())
-                self._queue_started = True
-            except RuntimeError:
-                # No event loop running yet, will try again later
-                pass
-    
-    async def _process_message_queue(self):
-        """Background task that processes queued messages one by one"""
+    def _ensure_store_thread(self):
+        """Start the writer thread on first use"""
+        if self._store_thread is None:
+            self._store_thread = threading.Thread(
+                target=self._store_loop, name="message_store", daemon=True
+            )
+            self._store_thread.start()
+    
+    def _store_loop(self):
+        """Writer thread: store queued batches under their pre-assigned ids"""
         while True:
-            try:
-                # Get next message from queue (blocks if empty)
-                message_data, result_future = await self.message_queue.get()
-                print(f"📦 Queue processor: Processing message from {message_data['from_agent']} to {message_data['to']}")
-                
-                # Process the message
+            with self._store_cond:
+                while not self._store_queue:
+                    self._store_cond.wait()
+                pending = list(self._store_queue)
+                self._store_queue.clear()
+            for message_ids, batch, loop in pending:
                 try:
-                    message_id = self._store_message_sync(message_data)
-                    result_future.set_result(message_id)
-                    print(f"✅ Queue processor: Message {message_id} stored and notified")
+                    self._store_batch(message_ids, batch, loop)
                 except Exception as e:
-                    print(f"❌ Queue processor error storing message: {e}")
-                    result_future.set_exception(e)
-                
-                # Small delay to prevent overwhelming WebSocket delivery
-                await asyncio.sleep(0.01)  # 10ms between messages
-                
-            except Exception as e:
-                print(f"Queue processor error: {e}")
-                await asyncio.sleep(0.1)
+                    print(f"❌ Store writer error storing messages {message_ids}: {e}")
+    
+    def _ensure_delivery(self, loop: asyncio.AbstractEventLoop):
+        """Bind the outbox and its delivery task to *loop* (call on that loop)"""
+        if self._loop is not loop or self._delivery_task is None or self._delivery_task.done():
+            self._loop = loop
+            self._outbox = asyncio.Queue()
+            self._backlog = {}
+            self._senders = {}
+            self._delivery_task = loop.create_task(self._deliver_loop(self._outbox))
+    
+    async def _deliver_loop(self, outbox: asyncio.Queue):
+        """Push stored messages to WebSocket clients, coalescing whatever is pending"""
+        while True:
+            messages = await outbox.get()
+            # Hold the first message briefly so a burst (e.g. a moderator
+            # batch) goes out as one frame per batching client
+            await asyncio.sleep(_COALESCE_WINDOW)
+            while not outbox.empty():
+                messages.extend(outbox.get_nowait())
+            self._dispatch(messages)
+    
+    def _dispatch(self, messages: List[StoredMsg]) -> None:
+        """Queue *messages* per recipient, starting a sender where none is running"""
+        for message in messages:
+            backlog = self._backlog.get(message.to)
+            if backlog is None:
+                self._backlog[message.to] = [message.to_dict()]
+                if message.to not in self._senders:
+                    self._senders[message.to] = self._loop.create_task(self._send_backlog(message.to))
+            else:
+                backlog.append(message.to_dict())
+    
+    async def _send_backlog(self, agent_id: str):
+        """Send *agent_id*'s backlog in order until it is empty.
+
+        Messages stored while a send is in flight join the next frame.
+        """
+        try:
+            while True:
+                payloads = self._backlog.pop(agent_id, None)
+                if not payloads:
+                    break
+                try:
+                    await manager.send_many(agent_id, payloads)
+                except Exception as e:
+                    print(f"⚠️  WebSocket notification to {agent_id} failed: {e}")
+        finally:
+            self._senders.pop(agent_id, None)
+    
+    def _next_id(self) -> str:
+        return f"{self._id_prefix}-{next(self._id_counter)}"
+    
+    async def store_batch_queued(self, batch: List[Dict]) -> List[str]:
+        """Queue several messages for the writer thread as a single item.
+
+        Returns the message ids in the order of *batch* straight away; storage
+        and delivery complete in the background.
+        """
+        loop = asyncio.get_running_loop()
+        self._ensure_delivery(loop)
+        message_ids = [self._next_id() for _ in batch]
+        self._ensure_store_thread()
+        with self._store_cond:
+            self._store_queue.append((message_ids, batch, loop))
+            self._store_cond.notify()
+        return message_ids
     
     async def store_message_queued(self, message_data: Dict) -> str:
-        """Store a message via the queue (non-blocking for concurrent requests)"""
-        self._ensure_queue_started()
-        if not self._queue_started:
-            # Fallback to sync if queue not available
-            return self._store_message_sync(message_data)
-            
-        result_future = asyncio.Future()
-        await self.message_queue.put((message_data, result_future))
-        return await result_future
+        """Queue a message for the writer thread (non-blocking for concurrent requests)"""
+        message_ids = await self.store_batch_queued([message_data])
+        return message_ids[0]
+    
+    def _build_message(self, message_id: str, message_data: Dict) -> StoredMsg:
+        return StoredMsg(
+            message_id,
+            message_data["from_agent"],
+            message_data["to"],
+            message_data["subject"],
+            message_data["body"],
+            _iso_now(),
+        )
+    
+    def _append_messages(self, message_ids: List[str], batch: List[Dict]) -> List[StoredMsg]:
+        """Build messages and add them to the store and its indexes"""
+        with self._store_lock:
+            messages = [
+                self._build_message(message_id, message_data)
+                for message_id, message_data in zip(message_ids, batch)
+            ]
+            # Index by id first, so anything that can see a message can also
+            # look it up (mark_delivered)
+            for message in messages:
+                self.message_status[message.message_id] = "sent"
+                self.by_id[message.message_id] = message
+            self.messages.extend(messages)
+            for message in messages:
+                self.by_recipient[message.to].append(message)
+                self.by_sender[message.frm].append(message)
+        return messages
+    
+    def _store_batch(self, message_ids: List[str], batch: List[Dict], loop: asyncio.AbstractEventLoop) -> None:
+        """Writer-thread storage of a batch; delivery is queued on *loop*'s outbox"""
+        messages = self._append_messages(message_ids, batch)
+        loop.call_soon_threadsafe(self._outbox.put_nowait, messages)
     
     def _store_message_sync(self, message_data: Dict) -> str:
-        """Synchronous message storage (used by queue processor)"""
-        message_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
-        
-        message = {
-            "message_id": message_id,
-            "from": message_data["from_agent"],
-            "to": message_data["to"],
-            "subject": message_data["subject"],
-            "body": message_data["body"],
-            "timestamp": timestamp,
-            "status": "sent"
-        }
+        """Synchronous message storage (used on the event loop thread)"""
+        message_id = self._next_id()
+        [message] = self._append_messages([message_id], [message_data])
         
-        self.messages.append(message)
-        self.message_status[message_id] = "sent"
-        
-        # After storing, attempt real-time delivery via WebSocket
+        # After storing, hand the message to the delivery task
         try:
-            # Get the current event loop and schedule the WebSocket notification
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(manager.send_json(message_data["to"], message))
-            else:
-                print(f"⚠️  No active event loop for WebSocket notification to {message_data['to']}")
-        except Exception as e:
-            print(f"⚠️  WebSocket notification failed: {e}")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            print(f"⚠️  No active event loop for WebSocket notification to {message_data['to']}")
+        else:
+            self._ensure_delivery(loop)
+            self._outbox.put_nowait([message])
         
         return message_id
     
@@ -208,24 +462,59 @@ class EmailServer:
         """Store a message and return its ID (legacy sync method)"""
         return self._store_message_sync(message_data)
     
-    def get_messages_for_agent(self, agent_id: str) -> List[Dict]:
+    def get_messages_for_agent(self, agent_id: str) -> List[StoredMsg]:
         """Get all messages for a specific agent"""
-        return [msg for msg in self.messages if msg["to"] == agent_id]
+        with self._store_lock:
+            return list(self.by_recipient.get(agent_id, ()))
+    
+    def get_messages_from_agent(self, agent_id: str) -> List[StoredMsg]:
+        """Get all messages sent by a specific agent"""
+        with self._store_lock:
+            return list(self.by_sender.get(agent_id, ()))
     
-    def get_all_messages(self) -> List[Dict]:
+    def get_conversation(self, agent_id: str) -> List[StoredMsg]:
+        """Get all messages sent or received by *agent_id*, oldest first"""
+        with self._store_lock:
+            sent = list(self.by_sender.get(agent_id, ()))
+            received = list(self.by_recipient.get(agent_id, ()))
+        # Messages to self are already in the sent list
+        received = (msg for msg in received if msg.frm != agent_id)
+        # Both lists are append-only and therefore already in timestamp order
+        return list(heapq.merge(sent, received, key=_timestamp_key))
+    
+    def get_messages_since(self, agent_id: str, since: Optional[str] = None) -> List[StoredMsg]:
+        """Get messages for *agent_id* stored after the message with id *since*.
+
+        Falls back to the full inbox when *since* is empty or unknown.
+        """
+        inbox = self.get_messages_for_agent(agent_id)
+        if since:
+            for idx in range(len(inbox) - 1, -1, -1):
+                if inbox[idx].message_id == since:
+                    return inbox[idx + 1:]
+        return inbox
+    
+    def get_all_messages(self) -> List[StoredMsg]:
         """Get all messages (for debugging/visualization)"""
-        return self.messages.copy()
+        with self._store_lock:
+            return self.messages.copy()
+    
+    def _clear_messages(self) -> None:
+        with self._store_lock:
+            self.messages.clear()
+            self.message_status.clear()
+            self.by_recipient.clear()
+            self.by_sender.clear()
+            self.by_id.clear()
     
     def clear_all_messages(self) -> None:
         """Clear all messages (useful for starting new rounds)"""
-        self.messages.clear()
-        self.message_status.clear()
+        self._clear_messages()
         print("📧 All messages cleared from email server")
     
     def clear_all_state(self) -> None:
         """Clear all server state (useful for testing)"""
-        self.messages.clear()
-        self.message_status.clear()
+        self._clear_messages()
         self.registered_agents.clear()
         self.waiting_queue.clear()
         self.current_game_in_progress = False
@@ -233,31 +522,25 @@ class EmailServer:
     
     def get_message_status(self, message_id: str) -> str:
         """Get the delivery status of a message"""
-        return self.message_status.get(message_id, "unknown")
+        with self._store_lock:
+            return self.message_status.get(message_id, "unknown")
+    
+    def _set_status(self, message_id: str, status: str) -> bool:
+        with self._store_lock:
+            message = self.by_id.get(message_id)
+            if message is None:
+                return False
+            self.message_status[message_id] = status
+            message.status = status
+            return True
     
     def mark_delivered(self, message_id: str) -> bool:
         """Mark a message as delivered"""
-        if message_id in self.message_status:
-            self.message_status[message_id] = "delivered"
-            # Update message in messages list
-            for msg in self.messages:
-                if msg["message_id"] == message_id:
-                    msg["status"] = "delivered"
-                    break
-            return True
-        return False
+        return self._set_status(message_id, "delivered")
     
     def mark_read(self, message_id: str) -> bool:
         """Mark a message as read"""
-        if message_id in self.message_status:
-            self.message_status[message_id] = "read"
-            # Update message in messages list
-            for msg in self.messages:
-                if msg["message_id"] == message_id:
-                    msg["status"] = "read"
-                    break
-            return True
-        return False
+        return self._set_status(message_id, "read")
     
     # ------------------------------------------------------------------
     # In-memory storage helpers (replaces Redis)
@@ -314,7 +597,8 @@ class EmailServer:
 email_server = EmailServer()
 
 # FastAPI app
-app = FastAPI(title="Inbox Arena Email Server", version="1.0.0")
+# Responses serialise with orjson – message lists can be large
+app = FastAPI(title="Inbox Arena Email Server", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Templates for dashboard
 templates = Jinja2Templates(directory="templates")
@@ -415,6 +699,29 @@ async def get_session_results():
         raise HTTPException(status_code=500, detail=f"Failed to get session results: {str(e)}")
 
 
+@app.get("/session_results/batch")
+async def get_session_results_batch(filenames: str = ""):
+    """Get several session result files in one call (?filenames=a.json,b.json).
+
+    Unsafe or missing filenames are left out of the returned mapping.
+    """
+    try:
+        results_dir = Path(__file__).resolve().parent.parent / "session_results"
+        data = {}
+        for filename in filter(None, filenames.split(",")):
+            # Same safety rules as the single-file endpoint
+            if not filename.endswith('.json') or '..' in filename or '/' in filename:
+                continue
+            file_path = results_dir / filename
+            if not file_path.exists():
+                continue
+            data[filename] = orjson.loads(file_path.read_bytes())
+        
+        return {"success": True, "data": data}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to read session results: {str(e)}")
+
+
 @app.get("/session_results/{filename}")
 async def get_session_result(filename: str):
     """Get a specific session result file"""
@@ -429,8 +736,7 @@ async def get_session_result(filename: str):
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="Session result not found")
         
-        with open(file_path, 'r') as f:
-            session_data = json.load(f)
+        session_data = orjson.loads(file_path.read_bytes())
         
         return {"success": True, "data": session_data}
     except HTTPException:
@@ -507,21 +813,19 @@ async def send_batch_messages(
             if not _validate_recipient(msg_request.to):
                 raise HTTPException(status_code=400, detail=f"Invalid recipient in batch: {msg_request.to}")
         
-        # Queue all messages concurrently
-        tasks = []
-        for msg_request in request.messages:
-            # Sender is derived from JWT token, not client payload
-            message_data = {
+        # Sender is derived from JWT token, not client payload
+        batch = [
+            {
                 "from_agent": token_agent,
                 "to": msg_request.to,
                 "subject": msg_request.subject,
                 "body": msg_request.body
             }
-            task = email_server.store_message_queued(message_data)
-            tasks.append(task)
+            for msg_request in request.messages
+        ]
         
-        # Wait for all messages to be processed
-        message_ids = await asyncio.gather(*tasks)
+        # One queue item for the whole batch
+        message_ids = await email_server.store_batch_queued(batch)
         
         for i, message_id in enumerate(message_ids):
             results.append({
@@ -547,13 +851,13 @@ async def get_messages(agent_id: str):
         
         # Mark messages as delivered when retrieved
         for msg in messages:
-            if msg["status"] == "sent":
-                email_server.mark_delivered(msg["message_id"])
+            if msg.status == "sent":
+                email_server.mark_delivered(msg.message_id)
         
         return {
             "success": True,
             "agent_id": agent_id,
-            "messages": messages,
+            "messages": _asdict(messages),
             "count": len(messages)
         }
     except Exception as e:
@@ -567,7 +871,7 @@ async def get_all_messages():
         messages = email_server.get_all_messages()
         return {
             "success": True,
-            "messages": messages,
+            "messages": _asdict(messages),
             "count": len(messages)
         }
     except Exception as e:
@@ -616,12 +920,12 @@ async def get_message_status(message_id: str):
 async def get_sent_messages(agent_id: str):
     """Get all messages that a specific agent has sent (their outbox)."""
     try:
-        sent_messages = [msg for msg in email_server.messages if msg["from"] == agent_id]
+        sent_messages = email_server.get_messages_from_agent(agent_id)
         # No status mutation for sent mail – outbox should reflect original state
         return {
             "success": True,
             "agent_id": agent_id,
-            "messages": sent_messages,
+            "messages": _asdict(sent_messages),
             "count": len(sent_messages)
         }
     except Exception as e:
@@ -632,21 +936,18 @@ async def get_sent_messages(agent_id: str):
 async def get_conversation(agent_id: str):
     """Get **all** messages involving the agent (sent or received) ordered by timestamp."""
     try:
-        # Filter messages where the agent is either sender or recipient
-        related = [msg for msg in email_server.messages if msg["from"] == agent_id or msg["to"] == agent_id]
-
-        # Sort by timestamp (ISO strings sort lexicographically in the same order as datetimes)
-        related.sort(key=lambda m: m["timestamp"])
+        # Messages where the agent is either sender or recipient, oldest first
+        related = email_server.get_conversation(agent_id)
 
         # Mark incoming *unseen* messages as delivered (same rule as inbox endpoint)
         for msg in related:
-            if msg["to"] == agent_id and msg["status"] == "sent":
-                email_server.mark_delivered(msg["message_id"])
+            if msg.to == agent_id and msg.status == "sent":
+                email_server.mark_delivered(msg.message_id)
 
         return {
             "success": True,
             "agent_id": agent_id,
-            "messages": related,
+            "messages": _asdict(related),
             "count": len(related)
         }
     except Exception as e:
@@ -697,47 +998,89 @@ async def leave_queue_endpoint(
 # ----------------------------
 
 
+# Concurrent WebSocket sends per batch in ConnectionManager.send_many
+_BROADCAST_CHUNK = 50
+
+
 class ConnectionManager:
     """Keeps track of active WebSocket connections per agent and allows sending push notifications."""
 
     def __init__(self):
-        # agent_id -> set[WebSocket]
-        self.active: Dict[str, set] = {}
-
-    async def connect(self, agent_id: str, websocket: WebSocket):
+        # agent_id -> list[WebSocket].  Lists are copy-on-write: connect and
+        # disconnect swap in a new list, so broadcasts can iterate the list
+        # they looked up without copying it.
+        self.active: Dict[str, list] = {}
+        # Connections that opted in (?batch=1) to {"batch": [...]} frames
+        self.batching: set = set()
+
+    async def connect(self, agent_id: str, websocket: WebSocket, batch: bool = False):
         await websocket.accept()
-        self.active.setdefault(agent_id, set()).add(websocket)
-        print(f"🔗 WebSocket connected for agent {agent_id} (total: {len(self.active.get(agent_id, set()))} connections)")
+        self.active[agent_id] = self.active.get(agent_id, []) + [websocket]
+        if batch:
+            self.batching.add(websocket)
+        print(f"🔗 WebSocket connected for agent {agent_id} (total: {len(self.active[agent_id])} connections)")
 
     def disconnect(self, agent_id: str, websocket: WebSocket):
-        if agent_id in self.active and websocket in self.active[agent_id]:
-            self.active[agent_id].remove(websocket)
-            if not self.active[agent_id]:
-                # clean empty entry
-                self.active.pop(agent_id, None)
+        self._drop(agent_id, (websocket,))
+
+    def _drop(self, agent_id: str, websockets):
+        self.batching.difference_update(websockets)
+        connections = self.active.get(agent_id)
+        if not connections:
+            return
+        remaining = [ws for ws in connections if ws not in websockets]
+        if remaining:
+            self.active[agent_id] = remaining
+        else:
+            # clean empty entry
+            self.active.pop(agent_id, None)
 
     async def send_json(self, agent_id: str, payload: Dict):
         """Send payload to all websockets listening for *agent_id*."""
-        if agent_id not in self.active:
+        await self.send_many(agent_id, [payload])
+
+    async def send_many(self, agent_id: str, payloads: List[Dict]):
+        """Send *payloads* in order to all websockets listening for *agent_id*.
+
+        Batching clients get a single ``{"batch": [...]}`` frame when there is
+        more than one payload; everyone else gets one frame per payload.
+        """
+        connections = self.active.get(agent_id)
+        if not connections:
             print(f"⚠️  No WebSocket connections for agent {agent_id}")
             return
         
-        print(f"📡 Sending WebSocket message to {agent_id} ({len(self.active[agent_id])} connections)")
+        print(f"📡 Sending {len(payloads)} WebSocket message(s) to {agent_id} ({len(connections)} connections)")
         dead_connections = []
-        sent_count = 0
-        
-        for ws in list(self.active[agent_id]):
-            try:
-                await ws.send_json(payload)
-                sent_count += 1
-            except Exception as e:
-                print(f"⚠️  WebSocket send failed: {e}")
-                dead_connections.append(ws)
-                
-        for ws in dead_connections:
-            self.disconnect(agent_id, ws)
-            
-        print(f"✅ WebSocket message sent to {sent_count} connections for {agent_id}")
+        # Encode once for every connection instead of per send call
+        frames = [orjson.dumps(payload).decode() for payload in payloads]
+        batch_frame = orjson.dumps({"batch": payloads}).decode() if len(payloads) > 1 and self.batching else None
+
+        async def push(ws: WebSocket):
+            if batch_frame is not None and ws in self.batching:
+                await ws.send_text(batch_frame)
+                return
+            for frame in frames:
+                await ws.send_text(frame)
+        
+        # Overlap the sends, yielding to the loop between chunks so a large
+        # fan-out doesn't starve HTTP handlers
+        for start in range(0, len(connections), _BROADCAST_CHUNK):
+            chunk = connections if len(connections) <= _BROADCAST_CHUNK else connections[start:start + _BROADCAST_CHUNK]
+            results = await asyncio.gather(
+                *(push(ws) for ws in chunk), return_exceptions=True
+            )
+            for ws, result in zip(chunk, results):
+                if isinstance(result, Exception):
+                    print(f"⚠️  WebSocket send failed: {result}")
+                    dead_connections.append(ws)
+            await asyncio.sleep(0)
+        
+        # Rebuild the list only when something actually died
+        if dead_connections:
+            self._drop(agent_id, dead_connections)
+        sent_count = len(connections) - len(dead_connections)
+        print(f"✅ WebSocket message(s) sent to {sent_count} connections for {agent_id}")
 
 
 # Instantiate global connection manager
@@ -768,8 +1111,7 @@ async def websocket_endpoint(websocket: WebSocket, agent_id: str):
         return
 
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
-        sub = payload.get("sub")
+        sub = await _token_subject(token)
         if sub != agent_id:
             await websocket.close(code=4403)  # forbidden
             return
@@ -777,8 +1119,24 @@ async def websocket_endpoint(websocket: WebSocket, agent_id: str):
         await websocket.close(code=4401)
         return
 
-    await manager.connect(agent_id, websocket)
+    batch = websocket.query_params.get("batch") == "1"
+    await manager.connect(agent_id, websocket, batch=batch)
     try:
+        # Replay anything the agent missed while disconnected – only for
+        # clients that ask with ?since=<message_id> (empty: whole inbox).
+        # Clients without it fetch their backlog over HTTP.
+        if "since" in websocket.query_params:
+            missed = email_server.get_messages_since(agent_id, websocket.query_params["since"])
+            for msg in missed:
+                if msg.status == "sent":
+                    email_server.mark_delivered(msg.message_id)
+            missed = _asdict(missed)
+            if batch and len(missed) > 1:
+                await websocket.send_text(orjson.dumps({"batch": missed}).decode())
+            else:
+                for msg in missed:
+                    await websocket.send_text(orjson.dumps(msg).decode())
+
         while True:
             # Keep the connection alive – we don't expect the agent to send data.
             await websocket.receive_text()
@@ -808,11 +1166,11 @@ async def _start_game_session(agent_ids: List[str]):
 
     # Persist roster for observability
     try:
-        with open("current_game.json", "w", encoding="utf-8") as fh:
-            json.dump({
+        with open("current_game.json", "wb") as fh:
+            fh.write(orjson.dumps({
                 "agents": agent_ids,
                 "started_at": datetime.utcnow().isoformat()
-            }, fh, indent=2)
+            }, option=orjson.OPT_INDENT_2))
     except Exception:  # pragma: no cover – non-fatal
         pass
 
@@ -835,17 +1193,7 @@ async def dashboard_home(request: Request, agent: str = None, agent1: str = None
     """Main dashboard page with optional agent filtering or dual-agent comparison"""
     try:
         # Get messages from our email server
-        messages = [
-            {
-                'timestamp': msg.get('timestamp', 'Unknown'),
-                'from': msg.get('from', 'Unknown'),
-                'to': msg.get('to', 'Unknown'),
-                'subject': msg.get('subject', 'No subject'),
-                'body': msg.get('body', 'No body'),
-                'status': msg.get('status', 'unknown')
-            }
-            for msg in email_server.messages
-        ]
+        messages = _asdict(email_server.get_all_messages())
         
         # Format timestamps
         formatted_messages = []
@@ -956,7 +1304,7 @@ async def dashboard_home(request: Request, agent: str = None, agent1: str = None
         """
         
         # Add messages to fallback HTML
-        for msg in sorted(email_server.messages, key=lambda x: x.get('timestamp', ''), reverse=True):
+        for msg in sorted(_asdict(email_server.get_all_messages()), key=lambda x: x.get('timestamp', ''), reverse=True):
             timestamp = msg.get('timestamp', 'Unknown')
             if timestamp != 'Unknown':
                 try:
@@ -1013,4 +1361,14 @@ async def dashboard_recent_games():
 if __name__ == "__main__":
     print("Starting Inbox Arena Email Server...")
     print("API documentation available at: http://localhost:8000/docs")
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Messages, queues and WebSocket connections live in this process, so the
+    # server must run as a single worker; uvloop/httptools speed that worker
+    # up where they are installed.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        workers=1,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+    ) 
\ No newline at end of file
@@ -178,7 +178,7 @@ async def run_single_round(round_number: int, selected_agents: List[Dict[str, st
     
     # Collect round statistics
     from src.email_server import email_server
-    messages = email_server.get_all_messages()
+    messages = [msg.to_dict() for msg in email_server.get_all_messages()]
     round_result.total_messages = len(messages)
     
     # Group messages by conversation
@@ -1,11 +1,11 @@
-"""RSA signature verification and scoring functions for the email game system"""
+"""Signature verification (RSA-PSS / Ed25519) and scoring functions for the email game system"""
 
 from typing import Dict, Any, List
 import json
 import base64
 import httpx
 from cryptography.hazmat.primitives import serialization, hashes
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import padding, ed25519
 
 from .config import PROJECT_ROOT
 
@@ -29,6 +29,47 @@ def load_agent_public_key(agent_id: str):
         return None
 
 
+def load_agent_ed25519_public_key(agent_id: str):
+    """Load an agent's Ed25519 public key from sample_agents.json (None if absent)"""
+    try:
+        agents_file = PROJECT_ROOT / "data" / "sample_agents.json"
+        with open(agents_file, 'r') as f:
+            data = json.load(f)
+        
+        for agent in data['agents']:
+            if agent['id'] == agent_id:
+                public_key_pem = agent.get('ed25519_public_key')
+                if not public_key_pem:
+                    return None
+                return serialization.load_pem_public_key(public_key_pem.encode())
+        
+        return None
+        
+    except Exception as e:
+        return None
+
+
+def verify_ed25519_signature(signed_message: Dict[str, Any], public_key) -> bool:
+    """Verify an Ed25519 signature from an agent"""
+    try:
+        if signed_message.get("signature_type") != "ed25519":
+            return False
+        if not isinstance(public_key, ed25519.Ed25519PublicKey):
+            return False
+        
+        # Recreate the signed data (same format as BaseAgent)
+        sign_data = (
+            f"{signed_message['original_message']}|{signed_message['signer']}|"
+            f"{signed_message['signed_for']}|{signed_message['timestamp']}"
+        )
+        
+        public_key.verify(base64.b64decode(signed_message["signature"]), sign_data.encode())
+        return True
+        
+    except Exception as e:
+        return False
+
+
 def verify_rsa_signature(signed_message: Dict[str, Any], public_key) -> bool:
     """Verify an RSA signature from an agent"""
     try:
@@ -109,14 +150,18 @@ async def process_submission_emails(agent_ids: List[str], request_lists: Dict[st
         
         print(f"[scoring] Found {len(submission_messages)} candidate submission emails out of {len(messages)} moderator messages.")
         
-        # Load agent RSA public keys
+        # Load agent RSA public keys (and Ed25519 keys where provisioned)
         agent_public_keys = {}
+        agent_ed25519_keys = {}
         for agent_id in agent_ids:
             public_key = load_agent_public_key(agent_id)
             if public_key:
                 agent_public_keys[agent_id] = public_key
             else:
                 print(f"[scoring] Failed to load public key for {agent_id}")
+            ed25519_key = load_agent_ed25519_public_key(agent_id)
+            if ed25519_key:
+                agent_ed25519_keys[agent_id] = ed25519_key
         
         # Track scores and detailed results
         agent_scores = {agent_id: 0 for agent_id in agent_ids}
@@ -195,13 +240,18 @@ async def process_submission_emails(agent_ids: List[str], request_lists: Dict[st
                         print(f"[scoring] Message mismatch for {submitter}->{signer}: expected '{expected_message[:40]}...', got '{original_message[:40]}...' ")
                         continue
                     
-                    # Step 6: Cryptographically verify RSA signature
-                    signer_public_key = agent_public_keys.get(signer)
+                    # Step 6: Cryptographically verify the signature (Ed25519 or RSA)
+                    if signed_message.get("signature_type") == "ed25519":
+                        signer_public_key = agent_ed25519_keys.get(signer)
+                        verify_signature = verify_ed25519_signature
+                    else:
+                        signer_public_key = agent_public_keys.get(signer)
+                        verify_signature = verify_rsa_signature
                     if not signer_public_key:
                         print(f"[scoring] Missing public key for signer {signer} – skipping.")
                         continue
                     
-                    if not verify_rsa_signature(signed_message, signer_public_key):
+                    if not verify_signature(signed_message, signer_public_key):
                         print(f"[scoring] Signature verification FAILED for signer {signer} (submitter {submitter}).")
                         continue
                     
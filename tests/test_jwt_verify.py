@@ -0,0 +1,80 @@
+"""HS256 verification in the email server (_verify_hs256 / _token_subject)."""
+
+import asyncio
+import base64
+import time
+
+import jwt
+import orjson
+import pytest
+
+from src import email_server
+from src.email_server import JWT_SECRET, _token_subject, _verify_hs256
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _token(claims, secret=JWT_SECRET):
+    return jwt.encode(claims, secret, algorithm="HS256")
+
+
+@pytest.fixture(autouse=True)
+def _empty_token_cache():
+    email_server._token_cache.clear()
+    yield
+    email_server._token_cache.clear()
+
+
+def test_valid_token_returns_claims():
+    claims = _verify_hs256(_token({"sub": "alice", "exp": time.time() + 60}))
+    assert claims["sub"] == "alice"
+
+
+def test_bad_signature_is_rejected():
+    token = _token({"sub": "alice"}, secret="some-other-secret-of-decent-length")
+    with pytest.raises(jwt.InvalidSignatureError):
+        _verify_hs256(token)
+
+
+def test_tampered_payload_is_rejected():
+    header, _, signature = _token({"sub": "alice"}).split(".")
+    payload = _b64(orjson.dumps({"sub": "moderator"}))
+    with pytest.raises(jwt.InvalidSignatureError):
+        _verify_hs256(f"{header}.{payload}.{signature}")
+
+
+def test_alg_none_is_rejected():
+    header = _b64(orjson.dumps({"alg": "none", "typ": "JWT"}))
+    payload = _b64(orjson.dumps({"sub": "alice"}))
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        _verify_hs256(f"{header}.{payload}.")
+
+
+def test_expired_token_is_rejected():
+    with pytest.raises(jwt.ExpiredSignatureError):
+        _verify_hs256(_token({"sub": "alice", "exp": time.time() - 1}))
+
+
+@pytest.mark.parametrize("token", [
+    "",
+    "onlyone",
+    "two.segments",
+    "a.b.c.d",
+    "!!!.###.$$$",
+    f"{_b64(b'not json')}.{_b64(b'{}')}.{_b64(b'sig')}",
+])
+def test_malformed_segments_are_rejected(token):
+    with pytest.raises(jwt.InvalidTokenError):
+        _verify_hs256(token)
+
+
+def test_token_subject_caches_only_valid_tokens():
+    token = _token({"sub": "alice", "exp": time.time() + 60})
+    assert asyncio.run(_token_subject(token)) == "alice"
+    assert len(email_server._token_cache) == 1
+
+    with pytest.raises(jwt.InvalidTokenError):
+        asyncio.run(_token_subject("x" * (email_server._MAX_TOKEN_LENGTH + 1)))
+    assert len(email_server._token_cache) == 1
@@ -0,0 +1,88 @@
+"""Missed-message replay: EmailServer.get_messages_since and the WebSocket ?since= parameter."""
+
+import time
+
+import jwt
+import pytest
+from starlette.testclient import TestClient
+
+from src import email_server as server_module
+from src.email_server import EmailServer, JWT_SECRET, app
+
+
+def _message(to, body, sender="moderator"):
+    return {"from_agent": sender, "to": to, "subject": "s", "body": body}
+
+
+@pytest.fixture
+def server():
+    server = EmailServer()
+    for body in ("one", "two", "three"):
+        server.store_message(_message("bob", body))
+    server.store_message(_message("carol", "other"))
+    return server
+
+
+def _bodies(messages):
+    return [msg.body for msg in messages]
+
+
+def _id_of(server, body):
+    return next(msg.message_id for msg in server.get_messages_for_agent("bob") if msg.body == body)
+
+
+def test_since_returns_only_later_messages(server):
+    assert _bodies(server.get_messages_since("bob", _id_of(server, "one"))) == ["two", "three"]
+
+
+def test_since_last_message_is_empty(server):
+    assert server.get_messages_since("bob", _id_of(server, "three")) == []
+
+
+@pytest.mark.parametrize("since", [None, "", "unknown-id"])
+def test_missing_or_unknown_since_returns_whole_inbox(server, since):
+    assert _bodies(server.get_messages_since("bob", since)) == ["one", "two", "three"]
+
+
+def test_since_ignores_other_recipients(server):
+    other_id = server.get_messages_for_agent("carol")[0].message_id
+    assert _bodies(server.get_messages_since("bob", other_id)) == ["one", "two", "three"]
+
+
+def _token(agent_id):
+    return jwt.encode({"sub": agent_id, "exp": time.time() + 60}, JWT_SECRET, algorithm="HS256")
+
+
+@pytest.fixture
+def client():
+    server_module.email_server.clear_all_state()
+    with TestClient(app) as client:
+        yield client
+    server_module.email_server.clear_all_state()
+
+
+def _send(client, body):
+    response = client.post(
+        "/send_message",
+        json={"to": "bob", "subject": "s", "body": body},
+        headers={"Authorization": f"Bearer {_token('alice')}"},
+    )
+    assert response.status_code == 200
+    time.sleep(0.05)  # let the delivery task run before the next step
+
+
+def test_websocket_without_since_does_not_replay(client):
+    _send(client, "old")
+    with client.websocket_connect(f"/ws/bob?token={_token('bob')}") as ws:
+        _send(client, "new")
+        assert ws.receive_json()["body"] == "new"
+    old = server_module.email_server.get_messages_for_agent("bob")[0]
+    assert old.status == "sent"
+
+
+def test_websocket_with_since_replays_missed_messages(client):
+    _send(client, "first")
+    first_id = server_module.email_server.get_messages_for_agent("bob")[0].message_id
+    _send(client, "second")
+    with client.websocket_connect(f"/ws/bob?token={_token('bob')}&since={first_id}") as ws:
+        assert ws.receive_json()["body"] == "second"
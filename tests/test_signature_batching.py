@@ -0,0 +1,129 @@
+"""Signature batching in CustomBaseAgent: size/timer flushes, re-queue, stop() drain."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from src.custom_base_agent import CustomBaseAgent
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(CustomBaseAgent, "_register_with_server", lambda self: None)
+    monkeypatch.setattr(CustomBaseAgent, "_join_queue", lambda self: None)
+    monkeypatch.setattr(CustomBaseAgent, "save_transcript", lambda self: None)
+    agent = CustomBaseAgent("alice", "alice")
+    agent._jwt_token = "token"
+    agent._jwt_expiry = time.time() + 3600
+    agent.signature_batch_window = 0.05
+    agent.signature_retry_delay = 0.05
+    return agent
+
+
+def _signature_count(body: str) -> int:
+    return len(json.loads(body)["signatures"])
+
+
+def _record_sync_sends(agent, monkeypatch):
+    sent = []
+
+    def send_message(to_agent, subject, body):
+        sent.append(_signature_count(body))
+        return {"success": True, "message_id": f"m{len(sent)}"}
+
+    monkeypatch.setattr(agent, "send_message", send_message)
+    return sent
+
+
+def _mock_server(agent, statuses):
+    """Point the agent's async client at a server answering with *statuses* in turn."""
+    requests = []
+
+    def handler(request):
+        requests.append(_signature_count(json.loads(request.content)["body"]))
+        status = statuses[min(len(requests), len(statuses)) - 1]
+        if status != 200:
+            return httpx.Response(status)
+        return httpx.Response(200, json={"success": True, "message_id": f"m{len(requests)}"})
+
+    agent._aclient = httpx.AsyncClient(
+        base_url=agent.email_server_url, transport=httpx.MockTransport(handler)
+    )
+    return requests
+
+
+def _run(agent, scenario):
+    async def main():
+        agent._loop = asyncio.get_running_loop()
+        agent.running = True
+        try:
+            return await scenario()
+        finally:
+            agent.running = False
+
+    return asyncio.run(main())
+
+
+def test_full_batch_flushes_from_worker_thread(agent, monkeypatch):
+    sent = _record_sync_sends(agent, monkeypatch)
+    agent.signature_batch_size = 3
+
+    async def scenario():
+        results = [await asyncio.to_thread(agent.submit_signature, {"n": i}) for i in range(3)]
+        await asyncio.sleep(0)  # let the threadsafe timer cancel run
+        return results
+
+    results = _run(agent, scenario)
+    assert results[0]["queued"] and results[1]["queued"]
+    assert results[2] == {"success": True, "message_id": "m1", "submitted": 3}
+    assert sent == [3]
+    assert agent._pending_signatures == []
+    assert agent._flush_handle is None
+
+
+def test_timer_flushes_partial_batch(agent):
+    requests = _mock_server(agent, [200])
+
+    async def scenario():
+        await asyncio.to_thread(agent.submit_signature, {"n": 1})
+        await asyncio.to_thread(agent.submit_signature, {"n": 2})
+        await asyncio.sleep(agent.signature_batch_window * 4)
+
+    _run(agent, scenario)
+    assert requests == [2]
+    assert agent._pending_signatures == []
+
+
+def test_failed_flush_is_requeued_and_retried(agent):
+    requests = _mock_server(agent, [500, 200])
+    agent.signature_retry_delay = 0.3
+
+    async def scenario():
+        await asyncio.to_thread(agent.submit_signature, {"n": 1})
+        await asyncio.sleep(agent.signature_batch_window * 3)
+        pending_after_failure = list(agent._pending_signatures)
+        await asyncio.sleep(agent.signature_retry_delay * 2)
+        return pending_after_failure
+
+    pending_after_failure = _run(agent, scenario)
+    assert pending_after_failure == [{"n": 1}]
+    assert requests == [1, 1]
+    assert agent._pending_signatures == []
+
+
+def test_stop_drains_pending_signatures(agent, monkeypatch):
+    sent = _record_sync_sends(agent, monkeypatch)
+
+    async def scenario():
+        await asyncio.to_thread(agent.submit_signature, {"n": 1})
+        await asyncio.to_thread(agent.submit_signature, {"n": 2})
+        agent.stop()
+        await asyncio.sleep(agent.signature_batch_window * 2)
+
+    _run(agent, scenario)
+    assert sent == [2]
+    assert agent._pending_signatures == []
@@ -0,0 +1,63 @@
+"""Rolling message_log window in CustomLLMDriver._trim_log."""
+
+import pytest
+
+from src.custom_llm_driver import CustomLLMDriver
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    return CustomLLMDriver("alice", "system prompt", lambda to, subject, body: {"success": True}, verbose=False)
+
+
+def _turn(n, results=2, size=10):
+    """One turn: the email, the assistant's tool calls and their results."""
+    turn = [
+        {"role": "user", "content": f"email {n}".ljust(size)},
+        {"role": "assistant", "content": "", "tool_call": [{"id": f"call-{n}-{i}"} for i in range(results)]},
+    ]
+    turn.extend({"role": "function", "name": "send_email", "content": f"result {n}.{i}"} for i in range(results))
+    return turn
+
+
+def _assert_whole_turns(log):
+    assert log[0]["role"] == "user"
+    for prev, msg in zip(log, log[1:]):
+        if msg["role"] == "function":
+            assert prev["role"] in ("assistant", "function")
+
+
+def test_message_budget_drops_whole_oldest_turns(driver):
+    driver._max_log_messages = 10
+    for n in range(6):
+        driver.message_log.extend(_turn(n))  # 4 messages per turn
+
+    driver._trim_log()
+
+    assert len(driver.message_log) <= 10
+    _assert_whole_turns(driver.message_log)
+    assert driver.message_log[-1]["content"] == "result 5.1"
+    assert driver.message_log[0]["content"].strip() == "email 4"
+
+
+def test_token_budget_never_orphans_tool_results(driver):
+    driver._max_log_tokens = 100  # ~400 characters
+    for n in range(5):
+        driver.message_log.extend(_turn(n, results=3, size=120))
+
+    driver._trim_log()
+
+    total_chars = sum(len(m.get("content") or "") for m in driver.message_log)
+    assert total_chars // 4 <= driver._max_log_tokens
+    _assert_whole_turns(driver.message_log)
+
+
+def test_latest_turn_is_kept_even_over_budget(driver):
+    driver._max_log_messages = 2
+    driver.message_log.extend(_turn(0))
+    driver.message_log.extend(_turn(1, results=4))
+
+    driver._trim_log()
+
+    assert driver.message_log == _turn(1, results=4)